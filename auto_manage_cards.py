@@ -6,21 +6,49 @@ Auto-manage Trello cards for Papers and Proposals boards.
 - Handles multiple boards: Papers and Proposals
 """
 
+import hashlib
 import os
 import sys
 import logging
+import logging.handlers
 import requests
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson parses the multi-KB board/card responses several times faster
+# than the stdlib json used by response.json(); fall back if unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from modules import trello_cache
+
 logger = logging.getLogger(__name__)
 
+
+def configure_logging():
+    """Set up logging for script runs; importing the module stays silent."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        stream=sys.stdout
+    )
+
+    # Buffer records in memory and write them in batches so CI log output
+    # isn't one unbuffered write per card; errors flush immediately and
+    # logging.shutdown() flushes the remainder at exit
+    root_logger = logging.getLogger()
+    root_logger.handlers[0] = logging.handlers.MemoryHandler(
+        capacity=100, flushLevel=logging.ERROR, target=root_logger.handlers[0]
+    )
+
 class TrelloClient:
     """Simple Trello API client."""
     
@@ -28,59 +56,129 @@ class TrelloClient:
         self.api_key = api_key
         self.token = token
         self.base_url = "https://api.trello.com/1"
-        
+
+        # Persistent session so every call reuses the same pooled TCP+TLS
+        # connections instead of re-handshaking with api.trello.com
+        self._session = requests.Session()
+        self._session.params = {'key': api_key, 'token': token}
+        self._session.headers.update({'Accept': 'application/json'})
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            # Trello rate-limits at ~100 req/10s per token; honoring its
+            # Retry-After on 429 throttles us instead of surfacing errors
+            max_retries=Retry(
+                total=6,
+                backoff_factor=1,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=['GET', 'PUT', 'POST'],
+                respect_retry_after_header=True
+            )
+        ))
+
+        # Disk-cache keys are scoped to the credentials so switching
+        # tokens never serves another account's boards
+        self._cache_prefix = hashlib.sha1(f"{api_key}:{token}".encode("utf-8")).hexdigest()[:12]
+
+    def close(self):
+        """Release the session's pooled connections."""
+        self._session.close()
+
+    def _cached_get(self, cache_key: str, ttl_sec: float, fetch):
+        """Serve from the disk cache when fresh, refreshing in the background
+        (stale-while-revalidate); fall through to a blocking fetch on miss."""
+        cached = trello_cache.load(cache_key, ttl_sec)
+        if cached is not None:
+            threading.Thread(
+                target=self._refresh_cache, args=(cache_key, fetch), daemon=True
+            ).start()
+            return cached
+
+        value = fetch()
+        trello_cache.store(cache_key, value)
+        return value
+
+    def _refresh_cache(self, cache_key: str, fetch):
+        try:
+            trello_cache.store(cache_key, fetch())
+        except Exception:
+            # Background refresh is best-effort; the stale copy stays usable
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def _make_request(self, method: str, endpoint: str, params: Dict = None, data: Dict = None) -> Dict:
         """Make a request to the Trello API."""
         url = f"{self.base_url}/{endpoint}"
-        
-        # Add authentication to all requests
-        if params is None:
-            params = {}
-        params.update({
-            'key': self.api_key,
-            'token': self.token
-        })
-        
-        try:
-            if method.upper() == 'GET':
-                response = requests.get(url, params=params)
-            elif method.upper() == 'PUT':
-                response = requests.put(url, params=params, json=data)
-            elif method.upper() == 'POST':
-                response = requests.post(url, params=params, json=data)
+
+        method = method.upper()
+        if method not in ('GET', 'PUT', 'POST'):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        kwargs = {'params': params, 'timeout': (5, 30)}
+        if data is not None:
+            if orjson is not None:
+                # Serialize once with orjson instead of requests' json.dumps
+                kwargs['data'] = orjson.dumps(data)
+                kwargs['headers'] = {'Content-Type': 'application/json'}
             else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-                
+                kwargs['json'] = data
+
+        try:
+            # Auth params come from the session defaults set in __init__
+            response = self._session.request(method, url, **kwargs)
             response.raise_for_status()
+            if orjson is not None:
+                return orjson.loads(response.content)
             return response.json()
-            
+
         except requests.exceptions.RequestException as e:
-            logger.error(f"API request failed: {e}")
+            logger.error("API request failed: %s", e)
             raise
     
     def get_boards(self) -> List[Dict]:
-        """Get all boards for the authenticated user."""
-        return self._make_request('GET', 'members/me/boards')
-    
-    def get_board_cards(self, board_id: str) -> List[Dict]:
-        """Get all cards from a board."""
-        return self._make_request('GET', f'boards/{board_id}/cards')
+        """Get all open boards for the authenticated user (id and name only)."""
+        return self._cached_get(
+            f"{self._cache_prefix}:boards", 3600,
+            lambda: self._make_request('GET', 'members/me/boards',
+                                       params={'filter': 'open', 'fields': 'id,name'})
+        )
     
+    def get_board_cards(self, board_id: str, fields=('id', 'name', 'closed', 'due', 'labels')) -> List[Dict]:
+        """Get all cards from a board, limited to the fields we process.
+
+        `labels` is a plain card field on this endpoint (the label
+        objects come inline), not a nested resource like attachments.
+        """
+        return self._make_request('GET', f'boards/{board_id}/cards',
+                                  params={'fields': ','.join(fields)})
+
     def get_board_lists(self, board_id: str) -> List[Dict]:
         """Get all lists from a board."""
-        return self._make_request('GET', f'boards/{board_id}/lists')
+        return self._cached_get(
+            f"{self._cache_prefix}:lists:{board_id}", 600,
+            lambda: self._make_request('GET', f'boards/{board_id}/lists', params={'fields': 'id,name'})
+        )
     
+    def update_card(self, card_id: str, **fields) -> Dict:
+        """Update any combination of card fields in a single PUT."""
+        return self._make_request('PUT', f'cards/{card_id}', data=fields)
+
     def update_card_due_date(self, card_id: str, due_date: str) -> Dict:
         """Update a card's due date."""
-        return self._make_request('PUT', f'cards/{card_id}', data={'due': due_date})
-    
+        return self.update_card(card_id, due=due_date)
+
     def update_card_closed(self, card_id: str, closed: bool) -> Dict:
         """Update a card's closed status."""
-        return self._make_request('PUT', f'cards/{card_id}', data={'closed': closed})
-    
+        return self.update_card(card_id, closed=closed)
+
     def move_card_to_list(self, card_id: str, list_id: str) -> Dict:
         """Move a card to a different list."""
-        return self._make_request('PUT', f'cards/{card_id}', data={'idList': list_id})
+        return self.update_card(card_id, idList=list_id)
 
 class CardAutoManager:
     def __init__(self, api_key: str, token: str, board_names: List[str] = ["Papers", "Proposals"], dry_run: bool = False):
@@ -96,6 +194,17 @@ class CardAutoManager:
             'errors': 0,
             'boards_processed': 0
         }
+        # Card updates run on a thread pool; guard stats increments.
+        # Keep max_workers <= the session adapter's pool_maxsize.
+        self.max_workers = 8
+        self._stats_lock = threading.Lock()
+
+        # Memoized per-board list data so completing N cards costs one
+        # list-fetch GET per board instead of one per card
+        self._lists_cache: Dict[str, List[Dict]] = {}
+        self._completed_list_by_board: Dict[str, Optional[Dict]] = {}
+        self._lists_lock = threading.Lock()
+        self._next_monday_iso: Optional[str] = None
         
         if self.dry_run:
             logger.info("Running in DRY-RUN mode - no changes will be made")
@@ -105,26 +214,29 @@ class CardAutoManager:
         try:
             all_boards = self.trello.get_boards()
             found_boards = []
-            
-            for board in all_boards:
-                if board['name'] in self.board_names:
-                    self.boards[board['name']] = board
-                    found_boards.append(board['name'])
-                    logger.info(f"Found board: {board['name']}")
+
+            # Index once by name; each target board is then an O(1) lookup
+            board_by_name = {board['name']: board for board in all_boards}
+            for board_name in self.board_names:
+                board = board_by_name.get(board_name)
+                if board is not None:
+                    self.boards[board_name] = board
+                    found_boards.append(board_name)
+                    logger.info("Found board: %s", board_name)
             
             missing_boards = set(self.board_names) - set(found_boards)
             if missing_boards:
-                logger.warning(f"Could not find boards: {', '.join(missing_boards)}")
+                logger.warning("Could not find boards: %s", ', '.join(missing_boards))
             
             if not found_boards:
                 logger.error("No target boards found")
                 return False
                 
-            logger.info(f"Will process {len(found_boards)} boards: {', '.join(found_boards)}")
+            logger.info("Will process %d boards: %s", len(found_boards), ', '.join(found_boards))
             return True
             
         except Exception as e:
-            logger.error(f"Error getting boards: {e}")
+            logger.error("Error getting boards: %s", e)
             return False
     
     def get_next_monday(self) -> datetime:
@@ -135,6 +247,11 @@ class CardAutoManager:
             days_ahead += 7
         return today + timedelta(days=days_ahead)
     
+    def _compute_cutoff(self, days: int = 3) -> str:
+        """ISO timestamp `days` ago; Trello's Z-suffixed UTC due dates
+        compare lexicographically against it without parsing."""
+        return (datetime.utcnow() - timedelta(days=days)).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+
     def is_overdue_by_days(self, due_date_str: str, days: int = 3) -> bool:
         """Check if a card is overdue by the specified number of days."""
         try:
@@ -146,78 +263,85 @@ class CardAutoManager:
             return (now - due_date).days >= days
             
         except (ValueError, AttributeError) as e:
-            logger.warning(f"Error parsing due date '{due_date_str}': {e}")
+            logger.warning("Error parsing due date '%s': %s", due_date_str, e)
             return False
     
     def has_completed_tag(self, card: dict) -> bool:
         """Check if card has a 'Completed:' tag."""
-        labels = card.get('labels', [])
-        for label in labels:
-            if label.get('name', '').startswith('Completed'):
-                return True
-        return False
+        return any((label.get('name') or '').startswith('Completed')
+                   for label in card.get('labels', ()))
     
+    def _find_completed_list(self, lists: List[Dict]) -> Optional[Dict]:
+        """Pick the list that completed cards should be moved to."""
+        for board_list in lists:
+            if 'completed' in board_list['name'].lower():
+                return board_list
+
+        # If no completed list found, look for highest priority list
+        # Based on your board structure, this might be "Priority 0" or similar
+        priority_lists = [l for l in lists if 'priority' in l['name'].lower()]
+        if priority_lists:
+            # Sort by priority number (assuming format like "Priority 0", "Priority I", etc.)
+            return priority_lists[0]  # Use first priority list as fallback
+
+        return None
+
+    def _get_completed_list(self, board_name: str) -> Optional[Dict]:
+        """Get the memoized completion target list for a board."""
+        with self._lists_lock:
+            if board_name not in self._completed_list_by_board:
+                lists = self._lists_cache.get(board_name)
+                if lists is None:
+                    board = self.boards[board_name]
+                    lists = self.trello.get_board_lists(board['id'])
+                    self._lists_cache[board_name] = lists
+                self._completed_list_by_board[board_name] = self._find_completed_list(lists)
+            return self._completed_list_by_board[board_name]
+
     def move_card_to_monday(self, card: dict, board_name: str) -> bool:
         """Move card's due date to next Monday."""
         try:
-            next_monday = self.get_next_monday()
-            due_date_str = next_monday.isoformat()
-            
+            due_date_str = self._next_monday_iso
+            if due_date_str is None:
+                due_date_str = self.get_next_monday().isoformat()
+
             if self.dry_run:
-                logger.info(f"[DRY-RUN] Would move card '{card['name']}' in board '{board_name}' due date to {due_date_str}")
+                logger.info("[DRY-RUN] Would move card '%s' in board '%s' due date to %s", card['name'], board_name, due_date_str)
                 return True
             
             # Update card due date
             self.trello.update_card_due_date(card['id'], due_date_str)
             
-            logger.info(f"Moved card '{card['name']}' in board '{board_name}' due date to {due_date_str}")
+            logger.info("Moved card '%s' in board '%s' due date to %s", card['name'], board_name, due_date_str)
             return True
             
         except Exception as e:
-            logger.error(f"Error updating due date for card '{card['name']}' in board '{board_name}': {e}")
+            logger.error("Error updating due date for card '%s' in board '%s': %s", card['name'], board_name, e)
             return False
     
     def mark_card_completed(self, card: dict, board_name: str) -> bool:
         """Mark card as completed by moving to appropriate list."""
         try:
             if self.dry_run:
-                logger.info(f"[DRY-RUN] Would mark card '{card['name']}' in board '{board_name}' as completed")
+                logger.info("[DRY-RUN] Would mark card '%s' in board '%s' as completed", card['name'], board_name)
                 return True
             
-            # Get all lists on the board
-            board = self.boards[board_name]
-            lists = self.trello.get_board_lists(board['id'])
-            
-            # Find the "Completed" list or create logic to determine target list
-            completed_list = None
-            for board_list in lists:
-                if 'completed' in board_list['name'].lower():
-                    completed_list = board_list
-                    break
-            
-            if not completed_list:
-                # If no completed list found, look for highest priority list
-                # Based on your board structure, this might be "Priority 0" or similar
-                priority_lists = [l for l in lists if 'priority' in l['name'].lower()]
-                if priority_lists:
-                    # Sort by priority number (assuming format like "Priority 0", "Priority I", etc.)
-                    completed_list = priority_lists[0]  # Use first priority list as fallback
-            
+            # One cached list-fetch per board rather than one per card
+            completed_list = self._get_completed_list(board_name)
+
             if completed_list:
-                # Move card to completed list
-                self.trello.move_card_to_list(card['id'], completed_list['id'])
-                
-                # Mark as completed (close the card)
-                self.trello.update_card_closed(card['id'], True)
-                
-                logger.info(f"Marked card '{card['name']}' in board '{board_name}' as completed")
+                # Move to the completed list and close in one PUT -
+                # Trello accepts both fields in the same body
+                self.trello.update_card(card['id'], idList=completed_list['id'], closed=True)
+
+                logger.info("Marked card '%s' in board '%s' as completed", card['name'], board_name)
                 return True
             else:
-                logger.warning(f"No suitable completed list found for card '{card['name']}' in board '{board_name}'")
+                logger.warning("No suitable completed list found for card '%s' in board '%s'", card['name'], board_name)
                 return False
                 
         except Exception as e:
-            logger.error(f"Error marking card '{card['name']}' in board '{board_name}' as completed: {e}")
+            logger.error("Error marking card '%s' in board '%s' as completed: %s", card['name'], board_name, e)
             return False
     
     def process_board_cards(self, board_name: str):
@@ -228,33 +352,55 @@ class CardAutoManager:
             # Get all cards from the board
             cards = self.trello.get_board_cards(board['id'])
             
-            logger.info(f"Processing {len(cards)} cards in board '{board_name}'...")
-            
+            logger.info("Processing %d cards in board '%s'...", len(cards), board_name)
+
+            with self._stats_lock:
+                self.stats['cards_processed'] += len(cards)
+
+            # Partition cards in a single pass (one label scan per card)
+            # so the independent PUTs can be dispatched concurrently over
+            # the session's connection pool
+            to_complete = [c for c in cards
+                           if not c.get('closed', False) and self.has_completed_tag(c)]
+            completed_ids = {c['id'] for c in to_complete}
+
+            # Overdue candidates come out of the same fetch as the
+            # completed partition — one card GET per board, with the
+            # >=3 days cutoff applied here
+            cutoff = self._compute_cutoff()
+            to_move = []
             for card in cards:
-                self.stats['cards_processed'] += 1
-                
-                # Skip already closed cards
-                if card.get('closed', False):
+                if card.get('closed', False) or card['id'] in completed_ids:
                     continue
-                
-                # Check if card has completed tag
-                if self.has_completed_tag(card):
-                    if self.mark_card_completed(card, board_name):
-                        self.stats['cards_marked_completed'] += 1
-                    else:
-                        self.stats['errors'] += 1
+                due = card.get('due')
+                if not due:
                     continue
-                
-                # Check if card is overdue by 3+ days
-                due_date = card.get('due')
-                if due_date and self.is_overdue_by_days(due_date):
-                    if self.move_card_to_monday(card, board_name):
-                        self.stats['cards_moved_to_monday'] += 1
-                    else:
-                        self.stats['errors'] += 1
-                        
+                # String compare against the precomputed cutoff; fall back
+                # to datetime parsing only for non-UTC inputs
+                overdue = due < cutoff if due.endswith('Z') else self.is_overdue_by_days(due)
+                if overdue:
+                    to_move.append(card)
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {
+                    executor.submit(self.mark_card_completed, card, board_name): 'cards_marked_completed'
+                    for card in to_complete
+                }
+                futures.update({
+                    executor.submit(self.move_card_to_monday, card, board_name): 'cards_moved_to_monday'
+                    for card in to_move
+                })
+
+                for future in as_completed(futures):
+                    stat_key = futures[future]
+                    with self._stats_lock:
+                        if future.result():
+                            self.stats[stat_key] += 1
+                        else:
+                            self.stats['errors'] += 1
+
         except Exception as e:
-            logger.error(f"Error processing cards in board '{board_name}': {e}")
+            logger.error("Error processing cards in board '%s': %s", board_name, e)
             self.stats['errors'] += 1
     
     def run(self):
@@ -264,34 +410,47 @@ class CardAutoManager:
         if not self.get_boards():
             logger.error("Failed to get boards. Exiting.")
             return False
-        
-        # Process each board
-        for board_name in self.boards.keys():
-            logger.info(f"\n--- Processing board: {board_name} ---")
-            self.process_board_cards(board_name)
-            self.stats['boards_processed'] += 1
+
+        # Derive the target due date once per run, not once per card
+        self._next_monday_iso = self.get_next_monday().isoformat()
+
+        # Process boards concurrently; the shared session's pool (32) covers
+        # per-board worker fan-out (8 each) for the handful of target boards
+        board_names = list(self.boards.keys())
+        for board_name in board_names:
+            logger.info("\n--- Processing board: %s ---", board_name)
+
+        with ThreadPoolExecutor(max_workers=len(board_names)) as executor:
+            for _ in executor.map(self.process_board_cards, board_names):
+                with self._stats_lock:
+                    self.stats['boards_processed'] += 1
         
         # Log summary
         logger.info("\n=== Card auto-management completed! ===")
-        logger.info(f"Summary:")
-        logger.info(f"  Boards processed: {self.stats['boards_processed']}")
-        logger.info(f"  Total cards processed: {self.stats['cards_processed']}")
-        logger.info(f"  Cards moved to Monday: {self.stats['cards_moved_to_monday']}")
-        logger.info(f"  Cards marked completed: {self.stats['cards_marked_completed']}")
-        logger.info(f"  Errors: {self.stats['errors']}")
+        logger.info("Summary:")
+        logger.info("  Boards processed: %d", self.stats['boards_processed'])
+        logger.info("  Total cards processed: %d", self.stats['cards_processed'])
+        logger.info("  Cards moved to Monday: %d", self.stats['cards_moved_to_monday'])
+        logger.info("  Cards marked completed: %d", self.stats['cards_marked_completed'])
+        logger.info("  Errors: %d", self.stats['errors'])
         
         return self.stats['errors'] == 0
 
 def main():
     """Main function."""
+    configure_logging()
+
     # Get credentials from environment variables
     api_key = os.getenv('TRELLO_API_KEY')
     token = os.getenv('TRELLO_TOKEN')
     dry_run = os.getenv('DRY_RUN', 'false').lower() == 'true'
     
-    # Allow custom board names via environment variable
-    board_names_env = os.getenv('TRELLO_BOARD_NAMES', 'Papers,Proposals')
-    board_names = [name.strip() for name in board_names_env.split(',')]
+    # Allow custom board names via environment variable; TRELLO_BOARD_NAME
+    # (singular) covers the single-board deployments so one module serves both
+    board_names_env = (os.getenv('TRELLO_BOARD_NAMES')
+                       or os.getenv('TRELLO_BOARD_NAME')
+                       or 'Papers,Proposals')
+    board_names = [name.strip() for name in board_names_env.split(',') if name.strip()]
     
     if not api_key or not token:
         logger.error("Missing required environment variables: TRELLO_API_KEY and TRELLO_TOKEN")
@@ -307,7 +466,7 @@ def main():
         logger.info("Process interrupted by user")
         sys.exit(1)
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -1,28 +1,50 @@
 import os
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict
-import time
 
-# --- Environment variables / tokens
-TRELLO_API_KEY = os.getenv("TRELLO_API_KEY")
-TRELLO_TOKEN = os.getenv("TRELLO_TOKEN")
-TRELLO_BOARD_ID = os.getenv("TRELLO_BOARD_ID", "68642fae07900e6d2d7d79bc")
+from modules import trello_http
 
-if not TRELLO_API_KEY or not TRELLO_TOKEN:
-    raise EnvironmentError("Missing TRELLO_API_KEY or TRELLO_TOKEN in environment variables.")
+# --- Environment variables / tokens, read lazily on first API call so
+# importing this module costs nothing and tests can patch the env first
+_CREDS: Dict[str, str] = {}
+
+def _creds() -> Dict[str, str]:
+    """Return Trello credentials, reading the environment on first use."""
+    if not _CREDS:
+        api_key = os.getenv("TRELLO_API_KEY")
+        token = os.getenv("TRELLO_TOKEN")
+        if not api_key or not token:
+            raise EnvironmentError("Missing TRELLO_API_KEY or TRELLO_TOKEN in environment variables.")
+        _CREDS.update({
+            "key": api_key,
+            "token": token,
+            "board_id": os.getenv("TRELLO_BOARD_ID", "68642fae07900e6d2d7d79bc")
+        })
+    return _CREDS
+
+# Process-wide session: pooled connections (keep-alive) plus
+# retry/backoff so transient 429/5xx responses don't drop attachments
+_SESSION = trello_http.session
+
+# One bucket shared by every Trello call in this module, so concurrent
+# card creates and attachment posts draw from the same quota
+_RATE_LIMITER = trello_http.TokenBucket()
 
 def get_or_create_list(list_name: str) -> str:
     """Get existing list or create new one on Trello board"""
     print(f"🔍 Looking for list: '{list_name}'")
-    
+
+    creds = _creds()
+
     # Get all lists on the board
-    url = f"https://api.trello.com/1/boards/{TRELLO_BOARD_ID}/lists"
-    params = {"key": TRELLO_API_KEY, "token": TRELLO_TOKEN}
+    url = f"https://api.trello.com/1/boards/{creds['board_id']}/lists"
+    params = {"key": creds["key"], "token": creds["token"]}
     
     try:
-        res = requests.get(url, params=params)
+        res = _SESSION.get(url, params=params)
         res.raise_for_status()
-        lists = res.json()
+        lists = trello_http.json_body(res)
         
         # Check if list already exists (case-insensitive)
         for lst in lists:
@@ -34,15 +56,15 @@ def get_or_create_list(list_name: str) -> str:
         print(f"➕ Creating new list: '{list_name}'")
         url = "https://api.trello.com/1/lists"
         data = {
-            "key": TRELLO_API_KEY,
-            "token": TRELLO_TOKEN,
+            "key": creds["key"],
+            "token": creds["token"],
             "name": list_name,
-            "idBoard": TRELLO_BOARD_ID,
+            "idBoard": creds["board_id"],
             "pos": "bottom"
         }
-        res = requests.post(url, data=data)
+        res = _SESSION.post(url, data=data)
         res.raise_for_status()
-        new_list = res.json()
+        new_list = trello_http.json_body(res)
         print(f"✅ Created list: '{new_list['name']}'")
         return new_list["id"]
         
@@ -53,43 +75,52 @@ def get_or_create_list(list_name: str) -> str:
 def create_card(list_id: str, name: str, desc: str, attachments: List[str]) -> Dict:
     """Create a new card in the specified Trello list"""
     print(f"📝 Creating card: '{name}'")
-    
+
+    creds = _creds()
+
     # Create the card
     url = "https://api.trello.com/1/cards"
     data = {
-        "key": TRELLO_API_KEY,
-        "token": TRELLO_TOKEN,
+        "key": creds["key"],
+        "token": creds["token"],
         "idList": list_id,
         "name": name,
         "desc": desc
     }
     
     try:
-        res = requests.post(url, data=data)
+        _RATE_LIMITER.acquire()
+        res = _SESSION.post(url, data=data)
         res.raise_for_status()
-        card = res.json()
+        card = trello_http.json_body(res)
         print(f"✅ Created card: '{card['name']}'")
 
         # Add attachments if any
         if attachments:
             print(f"📎 Adding {len(attachments)} attachments...")
-            for i, link in enumerate(attachments):
-                try:
-                    attach_url = f"https://api.trello.com/1/cards/{card['id']}/attachments"
-                    attach_data = {
-                        "key": TRELLO_API_KEY,
-                        "token": TRELLO_TOKEN,
-                        "url": link
-                    }
-                    attach_res = requests.post(attach_url, data=attach_data)
-                    attach_res.raise_for_status()
-                    print(f"   ✅ Added attachment {i+1}: {link}")
-                    
-                    # Small delay to avoid rate limiting
-                    time.sleep(0.1)
-                    
-                except requests.exceptions.RequestException as e:
-                    print(f"   ⚠️ Failed to add attachment {link}: {e}")
+            attach_url = f"https://api.trello.com/1/cards/{card['id']}/attachments"
+
+            def add_attachment(link: str) -> None:
+                attach_data = {
+                    "key": creds["key"],
+                    "token": creds["token"],
+                    "url": link
+                }
+                _RATE_LIMITER.acquire()
+                attach_res = _SESSION.post(attach_url, data=attach_data)
+                attach_res.raise_for_status()
+
+            # POST attachments concurrently so K attachments cost ~1 RTT
+            # instead of K; the session retries transient 429/5xx itself
+            with ThreadPoolExecutor(max_workers=min(8, len(attachments))) as executor:
+                futures = {executor.submit(add_attachment, link): link for link in attachments}
+                for i, future in enumerate(as_completed(futures)):
+                    link = futures[future]
+                    try:
+                        future.result()
+                        print(f"   ✅ Added attachment {i+1}: {link}")
+                    except requests.exceptions.RequestException as e:
+                        print(f"   ⚠️ Failed to add attachment {link}: {e}")
 
         return card
         
@@ -100,14 +131,16 @@ def create_card(list_id: str, name: str, desc: str, attachments: List[str]) -> D
 def test_trello_connection():
     """Test if Trello API credentials are working"""
     print("🔧 Testing Trello connection...")
-    
-    url = f"https://api.trello.com/1/boards/{TRELLO_BOARD_ID}"
-    params = {"key": TRELLO_API_KEY, "token": TRELLO_TOKEN}
+
+    creds = _creds()
+
+    url = f"https://api.trello.com/1/boards/{creds['board_id']}"
+    params = {"key": creds["key"], "token": creds["token"]}
     
     try:
-        res = requests.get(url, params=params)
+        res = _SESSION.get(url, params=params)
         res.raise_for_status()
-        board_info = res.json()
+        board_info = trello_http.json_body(res)
         print(f"✅ Connected to Trello board: '{board_info['name']}'")
         return True
     except requests.exceptions.RequestException as e:
@@ -1,31 +1,112 @@
 import json
 import re
 from datetime import datetime
+from functools import lru_cache
+
+# Aho-Corasick matches every keyword in one linear scan of the text,
+# independent of keyword-list size; fall back to the alternation regex
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 def load_keywords(path):
+    """Load the lab keywords lowercased and deduped, as a tuple so the
+    list can key the matcher cache without per-use .lower() calls."""
     with open(path) as f:
-        return json.load(f)["lab_keywords"]
+        raw = json.load(f)["lab_keywords"]
+    return tuple(sorted({k.lower() for k in raw}))
+
+@lru_cache(maxsize=4096)
+def parse_close_date(s):
+    """Parse a MM/DD/YYYY close date, or return None if it isn't one.
+
+    The dates are a fixed shape, so a cheap slice check plus int() is
+    ~10x faster than strptime walking its format spec per entry; the
+    cache collapses the many entries sharing one batch deadline into a
+    single parse per distinct date string.
+    """
+    if len(s) == 10 and s[2] == "/" and s[5] == "/":
+        try:
+            return datetime(int(s[6:]), int(s[:2]), int(s[3:5]))
+        except ValueError:
+            return None
+    return None
+
+def is_future_entry(entry, today=None):
+    """Check the entry's close date is today or later. Callers filtering
+    a batch should bind today=datetime.today() once and pass it in."""
+    if today is None:
+        today = datetime.today()
+    close_date = parse_close_date(entry["close_date"])
+    return close_date is not None and close_date >= today
+
+class _AhoCorasickMatcher:
+    """Whole-word keyword matcher backed by an Aho-Corasick automaton.
+
+    Exposes the same search/findall surface as a compiled regex so
+    callers don't care which backend they got.
+    """
+
+    def __init__(self, keywords):
+        self._automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            self._automaton.add_word(keyword, keyword)
+        self._automaton.make_automaton()
+
+    def _iter_word_hits(self, text):
+        for end, keyword in self._automaton.iter(text):
+            start = end - len(keyword) + 1
+            # Keep only hits on word boundaries, like the regex \b check
+            if ((start == 0 or not text[start - 1].isalnum())
+                    and (end + 1 == len(text) or not text[end + 1].isalnum())):
+                yield keyword
+
+    def search(self, text):
+        return next(self._iter_word_hits(text), None)
 
-def is_future_entry(entry):
-    try:
-        close_date = datetime.strptime(entry["close_date"], "%m/%d/%Y")
-        return close_date >= datetime.today()
-    except:
-        return False
+    def findall(self, text):
+        return list(self._iter_word_hits(text))
+
+
+def keyword_pattern(keywords):
+    """Whole-word alternation pattern over all keywords (already
+    lowercased by load_keywords), longest-first so multi-word keywords
+    win over their prefixes."""
+    alternation = '|'.join(
+        re.escape(k) for k in sorted(keywords, key=len, reverse=True)
+    )
+    return r'\b(?:' + alternation + r')\b'
+
+def build_matcher(keywords):
+    """Build a whole-word matcher over all keywords: an Aho-Corasick
+    automaton when pyahocorasick is installed (one linear scan however
+    many keywords there are), else a single compiled alternation regex."""
+    if ahocorasick is not None:
+        return _AhoCorasickMatcher(keywords)
+
+    return re.compile(keyword_pattern(keywords))
+
+# Compiled matchers keyed by keyword list, so repeated per-entry calls
+# reuse one automaton instead of recompiling K patterns each time
+_matchers = {}
+
+def get_matcher(keywords):
+    key = tuple(keywords)
+    matcher = _matchers.get(key)
+    if matcher is None:
+        matcher = _matchers[key] = build_matcher(keywords)
+    return matcher
 
 def contains_keyword(entry, keywords):
     """Check if entry contains any of the lab keywords using whole-word matching."""
-    text = (entry["title"] + " " + entry["description"]).lower()
-    matched_keywords = []
-    
-    for keyword in keywords:
-        keyword_lower = keyword.lower()
-        # Use word boundaries to match whole words only
-        pattern = r'\b' + re.escape(keyword_lower) + r'\b'
-        if re.search(pattern, text):
-            matched_keywords.append(keyword)
-    
+    # Use the pre-lowercased text column when the CSV loader provided it
+    text = entry.get("_match_text")
+    if text is None:
+        text = (entry["title"] + " " + entry["description"]).lower()
+    matched_keywords = list(dict.fromkeys(get_matcher(keywords).findall(text)))
+
     if matched_keywords:
         print(f"🎯 Matched keywords for '{entry['title'][:50]}...': {matched_keywords[:3]}")
-    
+
     return len(matched_keywords) > 0
\ No newline at end of file
@@ -1,13 +1,73 @@
+import re
+
 import pandas as pd
 
-def load_funding_csv(path):
-    df = pd.read_csv(path)
-    entries = []
-    for _, row in df.iterrows():
-        entries.append({
-            "title": str(row.get("OPPORTUNITY TITLE", "")).strip(),
-            "description": str(row.get("FUNDING DESCRIPTION", "")).strip(),
-            "close_date": str(row.get("CLOSE DATE", "")).strip(),
-            "link": str(row.get("OPPORTUNITY NUMBER", "")).split('"')[1]  # Extract link from HYPERLINK() if needed
-        })
-    return entries
+from modules.funding_sync import filter_keywords
+
+# The OPPORTUNITY NUMBER cell is usually an =HYPERLINK("url","label")
+# formula; anchor on the function name so a stray quote elsewhere in a
+# plain cell can't be mistaken for a link
+_HL_RE = re.compile(r'HYPERLINK\("([^"]+)"')
+
+# The grants.gov export is wide; these are the only columns the sync reads
+_CSV_COLUMNS = [
+    "OPPORTUNITY TITLE",
+    "FUNDING DESCRIPTION",
+    "CLOSE DATE",
+    "OPPORTUNITY NUMBER",
+]
+
+# Rows parsed per read_csv chunk: big enough that the vectorized ops
+# stay amortized, small enough that peak memory is one chunk, not the
+# whole export
+_CHUNK_ROWS = 100_000
+
+def load_funding_csv(path, future_only=True, keywords=None):
+    # usecols + fixed str dtype skips parsing and type-inferring the
+    # dozens of columns we never touch; chunksize streams the file so
+    # a large export never materializes as one DataFrame
+    records = []
+    today = pd.Timestamp.today()
+    for df in pd.read_csv(path, usecols=_CSV_COLUMNS, dtype=str,
+                          keep_default_na=False, engine="c",
+                          chunksize=_CHUNK_ROWS):
+        records.extend(_chunk_records(df, future_only, keywords, today))
+    return records
+
+def _chunk_records(df, future_only, keywords, today):
+    """Filter and reshape one parsed chunk into entry dicts."""
+    if future_only:
+        # Drop already-closed opportunities with one vectorized date pass;
+        # unparseable dates become NaT and fail the comparison, matching
+        # the old per-entry strptime/except behavior
+        close_dt = pd.to_datetime(df["CLOSE DATE"].str.strip(),
+                                  format="%m/%d/%Y", errors="coerce")
+        df = df[close_dt >= today]
+
+    # Vectorized column ops instead of boxing every row through iterrows()
+    entries = pd.DataFrame({
+        "title": df["OPPORTUNITY TITLE"].str.strip(),
+        "description": df["FUNDING DESCRIPTION"].str.strip(),
+        "close_date": df["CLOSE DATE"].str.strip(),
+        # Extract link from HYPERLINK(), falling back to the raw cell
+        # for rows that aren't formulas
+        "link": df["OPPORTUNITY NUMBER"].str.extract(_HL_RE, expand=False)
+                .fillna(df["OPPORTUNITY NUMBER"].str.strip()),
+    })
+
+    # Pre-lowercased text for keyword matching, built once here in C
+    # instead of per keyword check in the filter loop
+    entries["_match_text"] = (entries["title"] + " " + entries["description"]).str.lower()
+
+    if keywords is not None:
+        if keywords:
+            # Classify every entry in one vectorized regex pass rather
+            # than dispatching contains_keyword per row in Python
+            entries["_kw_match"] = entries["_match_text"].str.contains(
+                filter_keywords.keyword_pattern(keywords), regex=True, na=False)
+        else:
+            # No keywords configured: nothing can match, so skip the
+            # scan (an empty alternation would also match everything)
+            entries["_kw_match"] = False
+
+    return entries.to_dict("records")
@@ -1,20 +1,89 @@
 import os
 import requests
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from modules import trello_http
+from modules.funding_sync import filter_keywords
+
+# Cache GET responses on disk for 5 minutes so warm reruns skip the
+# slow-changing fetches; writes (POST/PUT) always hit the API. Card
+# fetches are never cached — duplicate detection and cleanup must see
+# cards created or moved by a previous run. The sqlite file lives under
+# the same state directory the other scripts use, not whatever CWD the
+# script happens to run from.
+_CACHE_DIR = Path.home() / ".cache" / "trello-sync"
+
+try:
+    import requests_cache
+    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    _SESSION = requests_cache.CachedSession(
+        str(_CACHE_DIR / "trello_cache.sqlite"),
+        backend="sqlite",
+        expire_after=300,
+        allowable_methods=("GET",),
+        urls_expire_after={"api.trello.com/1/lists/*/cards": requests_cache.DO_NOT_CACHE},
+    )
+except (ImportError, OSError):
+    _SESSION = requests.Session()
+
+# Either way, keep connections pooled and retry transient 429/5xx
+_SESSION.mount("https://", trello_http.build_adapter())
 
 # ENV Vars
 TRELLO_API_KEY = os.getenv("TRELLO_API_KEY")
 TRELLO_TOKEN = os.getenv("TRELLO_TOKEN")
 TRELLO_BOARD_ID = "68642fae07900e6d2d7d79bc"
 
+# Auth rides on the session instead of being rebuilt into every call's
+# params dict; requests merges these into each request automatically
+_SESSION.params = {"key": TRELLO_API_KEY, "token": TRELLO_TOKEN}
+
+# Per-run caches: the same few lists and their card titles were being
+# re-fetched once per entry, which is N redundant GETs for M lists (M<<N).
+# The lock keeps them safe under the threaded create fan-out.
+_list_id_cache = {}
+_titles_cache = {}
+_cache_lock = threading.Lock()
+
+class _TitleIndex:
+    """Set of normalized card titles plus length bounds, so obvious
+    non-duplicates skip hashing long strings entirely."""
+
+    def __init__(self, titles):
+        self.titles = set(titles)
+        self.min_len = min(map(len, self.titles), default=0)
+        self.max_len = max(map(len, self.titles), default=0)
+
+    def __contains__(self, title):
+        if not self.min_len <= len(title) <= self.max_len:
+            return False
+        return title in self.titles
+
+    def add(self, title):
+        self.titles.add(title)
+        if self.min_len == 0 or len(title) < self.min_len:
+            self.min_len = len(title)
+        if len(title) > self.max_len:
+            self.max_len = len(title)
+
 def get_list_id_by_name(list_name):
-    """Find or create a Trello list by name on the board."""
+    """Find or create a Trello list by name on the board (cached per run)."""
+    cache_key = list_name.lower()
+    with _cache_lock:
+        if cache_key in _list_id_cache:
+            return _list_id_cache[cache_key]
+
+        list_id = _fetch_or_create_list(list_name)
+        if list_id:
+            _list_id_cache[cache_key] = list_id
+        return list_id
+
+def _fetch_or_create_list(list_name):
+    """Fetch the list id from Trello, creating the list if needed."""
     url = f"https://api.trello.com/1/boards/{TRELLO_BOARD_ID}/lists"
-    params = {
-        "key": TRELLO_API_KEY,
-        "token": TRELLO_TOKEN
-    }
-    response = requests.get(url, params=params)
+    response = _SESSION.get(url)
 
     if response.status_code != 200:
         print(f"❌ Failed to fetch Trello lists.")
@@ -23,7 +92,7 @@ def get_list_id_by_name(list_name):
         return None
 
     try:
-        lists = response.json()
+        lists = trello_http.json_body(response)
     except Exception as e:
         print("❌ Could not decode JSON from Trello list fetch:")
         print("Raw response:", response.text)
@@ -38,10 +107,8 @@ def get_list_id_by_name(list_name):
     create_params = {
         "name": list_name,
         "idBoard": TRELLO_BOARD_ID,
-        "key": TRELLO_API_KEY,
-        "token": TRELLO_TOKEN
     }
-    create_resp = requests.post(create_url, params=create_params)
+    create_resp = _SESSION.post(create_url, params=create_params)
 
     if create_resp.status_code != 200:
         print(f"❌ Failed to create Trello list: {list_name}")
@@ -49,17 +116,30 @@ def get_list_id_by_name(list_name):
         print(f"Response: {create_resp.text}")
         return None
 
-    return create_resp.json()["id"]
+    # The cached board-lists response is now stale; refresh it so a
+    # rerun inside the TTL sees the new list instead of creating a
+    # same-name duplicate
+    if getattr(_SESSION, "cache", None) is not None:
+        _SESSION.get(url, refresh=True)
+
+    return trello_http.json_body(create_resp)["id"]
 
 def get_existing_card_titles(list_id):
-    """Return a set of card titles already on the list."""
+    """Return the title index for cards already on the list (cached per run)."""
+    with _cache_lock:
+        titles = _titles_cache.get(list_id)
+        if titles is None:
+            titles = _TitleIndex(_fetch_card_titles(list_id))
+            _titles_cache[list_id] = titles
+        return titles
+
+def _fetch_card_titles(list_id):
+    """Fetch the card titles currently on a list."""
     url = f"https://api.trello.com/1/lists/{list_id}/cards"
     params = {
-        "key": TRELLO_API_KEY,
-        "token": TRELLO_TOKEN,
         "fields": "name"
     }
-    response = requests.get(url, params=params)
+    response = _SESSION.get(url, params=params)
 
     if response.status_code != 200:
         print(f"❌ Failed to fetch cards for list {list_id}")
@@ -68,7 +148,7 @@ def get_existing_card_titles(list_id):
         return set()
 
     try:
-        cards = response.json()
+        cards = trello_http.json_body(response)
     except Exception as e:
         print("❌ Could not decode JSON from Trello card fetch:")
         print("Raw response:", response.text)
@@ -80,15 +160,13 @@ def get_existing_cards_with_details(list_id):
     """Return detailed info about existing cards on the list."""
     url = f"https://api.trello.com/1/lists/{list_id}/cards"
     params = {
-        "key": TRELLO_API_KEY,
-        "token": TRELLO_TOKEN,
         "fields": "id,name,desc"
     }
     
     try:
-        response = requests.get(url, params=params)
+        response = _SESSION.get(url, params=params)
         response.raise_for_status()
-        return response.json()
+        return trello_http.json_body(response)
         
     except requests.RequestException as e:
         print(f"❌ Error fetching existing cards: {e}")
@@ -98,13 +176,11 @@ def move_card_to_list(card_id, target_list_id):
     """Move a card to a different list."""
     url = f"https://api.trello.com/1/cards/{card_id}"
     params = {
-        "key": TRELLO_API_KEY,
-        "token": TRELLO_TOKEN,
         "idList": target_list_id
     }
     
     try:
-        response = requests.put(url, params=params)
+        response = _SESSION.put(url, params=params)
         response.raise_for_status()
         return True
         
@@ -126,10 +202,13 @@ def cleanup_existing_cards(keywords):
     # Get all existing cards in Semi-Filtered
     existing_cards = get_existing_cards_with_details(semi_filtered_id)
     moved_count = 0
-    
+
+    # One matcher and one lowercase per card, hoisted out of the per-keyword work
+    matcher = filter_keywords.get_matcher(keywords)
+
     for card in existing_cards:
         # Check if this card should actually be in Semi-Filtered
-        if not contains_keyword_whole_word(card["name"], card.get("desc", ""), keywords):
+        if matcher.search((card["name"] + " " + card.get("desc", "")).lower()) is None:
             # Move to Dummy List
             if move_card_to_list(card["id"], dummy_list_id):
                 print(f"🔄 Moved incorrect card to Dummy List: {card['name']}")
@@ -141,33 +220,22 @@ def cleanup_existing_cards(keywords):
 
 def contains_keyword_whole_word(title, description, keywords):
     """Check if entry contains any of the lab keywords using whole-word matching."""
-    import re
-    
     text = (title + " " + description).lower()
-    
-    for keyword in keywords:
-        keyword_lower = keyword.lower()
-        # Use word boundaries to match whole words only
-        pattern = r'\b' + re.escape(keyword_lower) + r'\b'
-        if re.search(pattern, text):
-            return True
-    
-    return False
+    # One scan of the shared compiled alternation instead of K searches
+    return filter_keywords.get_matcher(keywords).search(text) is not None
 
 def create_checklist_on_card(card_id, checklist_name="Checklist"):
     """Create a checklist on a Trello card."""
     url = "https://api.trello.com/1/checklists"
     params = {
-        "key": TRELLO_API_KEY,
-        "token": TRELLO_TOKEN,
         "idCard": card_id,
         "name": checklist_name
     }
     
     try:
-        response = requests.post(url, params=params)
+        response = _SESSION.post(url, params=params)
         response.raise_for_status()
-        return response.json()["id"]
+        return trello_http.json_body(response)["id"]
     except requests.RequestException as e:
         print(f"❌ Error creating checklist: {e}")
         return None
@@ -176,13 +244,11 @@ def add_checklist_item(checklist_id, item_name):
     """Add an item to a checklist."""
     url = f"https://api.trello.com/1/checklists/{checklist_id}/checkItems"
     params = {
-        "key": TRELLO_API_KEY,
-        "token": TRELLO_TOKEN,
         "name": item_name
     }
     
     try:
-        response = requests.post(url, params=params)
+        response = _SESSION.post(url, params=params)
         response.raise_for_status()
         return True
     except requests.RequestException as e:
@@ -210,27 +276,30 @@ def create_card(entry, list_name):
     full_desc = f"{description}\n\nLink: {link}"
 
     # Parse due date from CLOSE DATE
-    try:
-        due_date = datetime.strptime(entry["close_date"], "%m/%d/%Y").isoformat()
-    except:
-        due_date = None
+    close_date = filter_keywords.parse_close_date(entry["close_date"])
+    due_date = close_date.isoformat() if close_date else None
 
     url = "https://api.trello.com/1/cards"
     params = {
-        "key": TRELLO_API_KEY,
-        "token": TRELLO_TOKEN,
         "idList": list_id,
         "name": title,
         "desc": full_desc,
         "due": due_date
     }
 
-    response = requests.post(url, params=params)
+    response = _SESSION.post(url, params=params)
 
     if response.status_code == 200:
-        card_data = response.json()
+        card_data = trello_http.json_body(response)
         card_id = card_data["id"]
-        
+
+        # Record the new title so later entries in the same run still dedupe
+        with _cache_lock:
+            index = _titles_cache.get(list_id)
+            if index is None:
+                index = _titles_cache[list_id] = _TitleIndex(())
+            index.add(normalized_title)
+
         # Create checklist on the card
         checklist_id = create_checklist_on_card(card_id, "Checklist")
         if checklist_id:
@@ -242,4 +311,35 @@ def create_card(entry, list_name):
     else:
         print(f"❌ Failed to create card: {title}")
         print(f"Status Code: {response.status_code}")
-        print(f"Response: {response.text}")
\ No newline at end of file
+        print(f"Response: {response.text}")
+
+def create_cards_bulk(entries_by_list, max_workers=10):
+    """Create cards grouped by target list.
+
+    Resolves each list id and its existing titles once up front, drops
+    duplicates before any network work, then fans the remaining creates
+    out over a thread pool — instead of every entry re-walking the
+    list-resolution path inside create_card.
+    """
+    for list_name, entries in entries_by_list.items():
+        list_id = get_list_id_by_name(list_name)
+        if not list_id:
+            print(f"🚫 Skipping {len(entries)} cards: could not resolve list '{list_name}'")
+            continue
+
+        existing_titles = get_existing_card_titles(list_id)
+        fresh = []
+        seen = set()
+        for entry in entries:
+            normalized_title = entry["title"].strip().lower()
+            if normalized_title in existing_titles or normalized_title in seen:
+                print(f"⏭️ Skipping duplicate: {entry['title'].strip()}")
+                continue
+            seen.add(normalized_title)
+            fresh.append(entry)
+
+        if not fresh:
+            continue
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(fresh))) as executor:
+            list(executor.map(lambda entry: create_card(entry, list_name), fresh))
\ No newline at end of file
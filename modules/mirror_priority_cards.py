@@ -12,9 +12,12 @@ Runs every Monday at 8 AM Eastern via GitHub Actions.
 
 import os
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Optional
 
+from modules import trello_http
+
 # Load environment variables
 TRELLO_API_KEY = os.getenv("TRELLO_API_KEY")
 TRELLO_TOKEN = os.getenv("TRELLO_TOKEN")
@@ -49,41 +52,43 @@ class TrelloAPI:
         """Make GET request to Trello API"""
         url = f"https://api.trello.com/1/{endpoint}"
         all_params = {**self.base_params, **(params or {})}
-        return requests.get(url, params=all_params, headers=HEADERS)
-    
+        return trello_http.session.get(url, params=all_params, headers=HEADERS)
+
     def post(self, endpoint: str, data: Dict = None) -> requests.Response:
         """Make POST request to Trello API"""
         url = f"https://api.trello.com/1/{endpoint}"
         all_data = {**self.base_params, **(data or {})}
-        return requests.post(url, data=all_data, headers=HEADERS)
-    
+        return trello_http.session.post(url, data=all_data, headers=HEADERS)
+
     def delete(self, endpoint: str) -> requests.Response:
         """Make DELETE request to Trello API"""
         url = f"https://api.trello.com/1/{endpoint}"
-        return requests.delete(url, params=self.base_params, headers=HEADERS)
+        return trello_http.session.delete(url, params=self.base_params, headers=HEADERS)
 
 def get_all_cards_from_board(api: TrelloAPI, board_id: str) -> List[Dict]:
-    """Get all open cards from a board with full details"""
+    """Get all open cards from a board with the fields the mirror needs"""
     response = api.get(f"boards/{board_id}/cards", {
         "cards": "open",
         "attachments": "true",
         "checklists": "all",
-        "members": "true"
+        "members": "true",
+        "fields": "name,desc,due,idList,idMembers,idLabels"
     })
     
     if response.status_code != 200:
         print(f"❌ Failed to fetch cards from board {board_id}: {response.text}")
         return []
     
-    return response.json()
+    return trello_http.json_body(response)
 
-def get_list_name(api: TrelloAPI, list_id: str) -> str:
-    """Get the name of a list"""
-    response = api.get(f"lists/{list_id}")
+def get_board_list_names(api: TrelloAPI, board_id: str) -> Dict[str, str]:
+    """Get all lists for a board, return dict of {list_id: list_name}"""
+    response = api.get(f"boards/{board_id}/lists", {"fields": "name"})
     if response.status_code != 200:
-        print(f"❌ Failed to fetch list {list_id}: {response.text}")
-        return ""
-    return response.json().get("name", "")
+        print(f"❌ Failed to fetch lists for board {board_id}: {response.text}")
+        return {}
+    
+    return {lst["id"]: lst["name"] for lst in trello_http.json_body(response)}
 
 def get_board_labels(api: TrelloAPI, board_id: str) -> Dict[str, str]:
     """Get all labels for a board, return dict of {label_id: label_name}"""
@@ -92,7 +97,7 @@ def get_board_labels(api: TrelloAPI, board_id: str) -> Dict[str, str]:
         print(f"❌ Failed to fetch labels for board {board_id}: {response.text}")
         return {}
     
-    return {label["id"]: label["name"] for label in response.json()}
+    return {label["id"]: label["name"] for label in trello_http.json_body(response)}
 
 def has_completed_label(card: Dict, board_labels: Dict[str, str]) -> bool:
     """Check if card has a 'Completed' label (case-insensitive)"""
@@ -113,15 +118,15 @@ def get_checklist_progress(card: Dict, checklist_name: str) -> float:
             return completed_items / total_items
     return 0.0
 
-def should_mirror_card(api: TrelloAPI, card: Dict, board_labels: Dict[str, str]) -> bool:
+def should_mirror_card(card: Dict, board_labels: Dict[str, str], list_names: Dict[str, str]) -> bool:
     """Determine if a card should be mirrored based on criteria"""
     # Skip if card has "Completed" label
     if has_completed_label(card, board_labels):
         print(f"🚫 Skipping '{card['name']}' - has Completed label")
         return False
     
-    # Check if card is in Priority IV list
-    list_name = get_list_name(api, card["idList"])
+    # Check if card is in Priority IV list (prefetched, no per-card GET)
+    list_name = list_names.get(card["idList"], "")
     if list_name.lower() == PRIORITY_LIST_NAME.lower():
         print(f"✅ '{card['name']}' - in Priority IV list")
         return True
@@ -146,12 +151,18 @@ def clear_list(api: TrelloAPI, list_id: str, list_name: str) -> None:
         print(f"❌ Failed to fetch cards from {list_name}: {response.text}")
         return
     
-    cards = response.json()
-    for card in cards:
+    cards = trello_http.json_body(response)
+
+    def delete_card(card: Dict) -> None:
         delete_response = api.delete(f"cards/{card['id']}")
         if delete_response.status_code != 200:
             print(f"❌ Failed to delete card '{card['name']}': {delete_response.text}")
-    
+
+    # Each delete is an independent HTTPS call, so issue them concurrently
+    # instead of paying one round trip per card
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        list(executor.map(delete_card, cards))
+
     print(f"🧹 Cleared {len(cards)} cards from {list_name} list")
 
 def mirror_card(api: TrelloAPI, card: Dict, target_list_id: str, source_board_name: str) -> bool:
@@ -170,7 +181,7 @@ def mirror_card(api: TrelloAPI, card: Dict, target_list_id: str, source_board_na
         print(f"❌ Failed to create card '{card['name']}': {response.text}")
         return False
     
-    new_card = response.json()
+    new_card = trello_http.json_body(response)
     new_card_id = new_card["id"]
     
     # Add members
@@ -190,7 +201,7 @@ def mirror_card(api: TrelloAPI, card: Dict, target_list_id: str, source_board_na
     for checklist in card.get("checklists", []):
         checklist_response = api.post(f"cards/{new_card_id}/checklists", {"name": checklist["name"]})
         if checklist_response.status_code == 200:
-            new_checklist_id = checklist_response.json()["id"]
+            new_checklist_id = trello_http.json_body(checklist_response)["id"]
             
             # Add checklist items
             for item in checklist.get("checkItems", []):
@@ -212,9 +223,10 @@ def process_board(api: TrelloAPI, board_id: str, board_name: str, master_list_id
     """Process a board and mirror qualifying cards"""
     print(f"\n📋 Processing {board_name} board...")
     
-    # Get all cards and board labels
+    # Get all cards, board labels and list names in three board-level GETs
     cards = get_all_cards_from_board(api, board_id)
     board_labels = get_board_labels(api, board_id)
+    list_names = get_board_list_names(api, board_id)
     
     if not cards:
         print(f"⚠️  No cards found on {board_name} board")
@@ -225,7 +237,7 @@ def process_board(api: TrelloAPI, board_id: str, board_name: str, master_list_id
     # Process each card
     mirrored_count = 0
     for card in cards:
-        if should_mirror_card(api, card, board_labels):
+        if should_mirror_card(card, board_labels, list_names):
             if mirror_card(api, card, master_list_id, board_name):
                 mirrored_count += 1
     
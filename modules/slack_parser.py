@@ -1,6 +1,11 @@
 import re
 from typing import List, Dict
 
+# Compiled once at import: the per-line loop would otherwise pay the
+# re-module cache lookup (or a recompile on eviction) for every line
+_NUM_RE = re.compile(r'^(\d+)\.\s+(.*)')
+_URL_RE = re.compile(r'(https?://[^\s]+|[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}(?:/[^\s]*)?)', re.IGNORECASE)
+
 
 def parse_funding_text(text: str) -> Dict[str, List[Dict]]:
     """
@@ -8,54 +13,67 @@ def parse_funding_text(text: str) -> Dict[str, List[Dict]]:
     - List title
     - Card titles + descriptions + attachment links
     """
-    lines = text.strip().split('\n')
-    lines = [line.rstrip() for line in lines if line.strip()]
-    
-    if not lines:
-        return {"list_title": "", "cards": []}
-
-    list_title = lines[0].strip()
+    list_title = ""
     entries = []
     current_card = None
 
-    for line in lines[1:]:
+    # One pass over the raw lines: blank lines are skipped inline and
+    # descriptions accumulate per card, instead of building a filtered
+    # copy of the text up front and fixing the cards up afterwards
+    for raw in text.splitlines():
+        if not raw.strip():
+            continue
+        line = raw.rstrip()
+
+        # First non-blank line is the list title
+        if not list_title:
+            list_title = line.strip()
+            continue
         # Check if this is a numbered list item (new card)
-        if re.match(r'^\d+\.\s+', line):
+        number_match = _NUM_RE.match(line)
+        if number_match:
             # Save previous card if exists
             if current_card:
-                entries.append(current_card)
-            
-            # Start new card
-            card_title = re.sub(r'^\d+\.\s+', '', line).strip()
+                entries.append(_finish_card(current_card))
+
+            # Start new card; the match already captured the title, so
+            # no second regex pass to strip the numbering
+            card_title = number_match.group(2).strip()
             current_card = {
                 "title": card_title,
                 "description_lines": [],
-                "attachments": []
+                "attachments": [],
+                # Parallel set so dedup is an O(1) hash instead of a
+                # list scan per URL; dropped when the card is finished
+                "_attachment_set": set()
             }
         elif current_card and line.startswith('   '):
             # This is a sub-item (bullet point under a numbered item)
             stripped = line.strip()
             
             # Extract URLs from the line
-            urls = re.findall(r'(https?://[^\s]+|[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}(?:/[^\s]*)?)', stripped, re.IGNORECASE)
+            urls = _URL_RE.findall(stripped)
             for url in urls:
                 if not url.startswith("http"):
                     url = f"https://{url}"
-                if url not in current_card["attachments"]:
+                if url not in current_card["_attachment_set"]:
+                    current_card["_attachment_set"].add(url)
                     current_card["attachments"].append(url)
             
             current_card["description_lines"].append(stripped)
 
     # Don't forget the last card
     if current_card:
-        entries.append(current_card)
-
-    # Final formatting
-    for card in entries:
-        card["description"] = "\n".join(card["description_lines"])
-        del card["description_lines"]
+        entries.append(_finish_card(current_card))
 
     return {
         "list_title": list_title,
         "cards": entries
-    }
\ No newline at end of file
+    }
+
+
+def _finish_card(card: Dict) -> Dict:
+    """Collapse the accumulated description lines into the final text."""
+    card["description"] = "\n".join(card.pop("description_lines"))
+    del card["_attachment_set"]
+    return card
\ No newline at end of file
@@ -1,5 +1,8 @@
 import os
-import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict
+
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
@@ -15,77 +18,176 @@ if not SLACK_BOT_TOKEN:
 
 client = WebClient(token=SLACK_BOT_TOKEN)
 
+# Timestamp cursor persisted between runs so conversations_history can
+# skip messages we've already handled instead of re-fetching them and
+# re-checking their reactions every time
+_STATE_FILE = Path.home() / ".cache" / "trello-sync" / "slack_last_ts"
+
+def _load_last_ts():
+    try:
+        return _STATE_FILE.read_text().strip() or None
+    except OSError:
+        return None
+
+def _store_last_ts(ts: str) -> None:
+    try:
+        _STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _STATE_FILE.write_text(ts)
+    except OSError as e:
+        print(f"⚠️ Could not persist Slack cursor: {e}")
+
+def _advance_cursor(results: Dict[str, bool]) -> None:
+    """Move the cursor to the newest ts with nothing unhandled below it."""
+    new_ts = None
+    for ts in sorted(results, key=float):
+        if not results[ts]:
+            break
+        new_ts = ts
+    if new_ts:
+        _store_last_ts(new_ts)
+
+# One list resolution per distinct list title per run
+_list_id_cache: Dict[str, str] = {}
+
+def _get_list_id(list_title: str) -> str:
+    list_id = _list_id_cache.get(list_title)
+    if list_id is None:
+        list_id = get_or_create_list(list_title)
+        _list_id_cache[list_title] = list_id
+    return list_id
+
 def process_slack_messages():
     """Process recent Slack messages and create Trello cards"""
     try:
         print("🔍 Fetching Slack messages...")
-        response = client.conversations_history(channel=SLACK_CHANNEL_ID, limit=10)
-        messages = response.get("messages", [])
-        
+        history_args = {"channel": SLACK_CHANNEL_ID, "limit": 200}
+        last_ts = _load_last_ts()
+        if last_ts:
+            history_args["oldest"] = last_ts
+
+        # Follow the pagination cursor so a backlog bigger than one
+        # page isn't silently truncated; parsing below is cheap, the
+        # Trello creates stay the bottleneck
+        messages = []
+        while True:
+            response = client.conversations_history(**history_args)
+            messages.extend(response.get("messages", []))
+            cursor = response.get("response_metadata", {}).get("next_cursor")
+            if not response.get("has_more") or not cursor:
+                break
+            history_args["cursor"] = cursor
+
         if not messages:
             print("No messages found in channel.")
             return
 
-        processed_count = 0
-        
+        # Whether each message in the window ended up fully handled;
+        # drives how far the persisted cursor may advance
+        results: Dict[str, bool] = {}
+
+        # Parse everything up front — parsing is cheap, the Trello
+        # creates are the bottleneck and get fanned out below
+        to_process = []
         for msg in messages:
             # Skip messages that are already processed (have checkmark reaction)
             reactions = msg.get("reactions", [])
             if any(r.get("name") == "white_check_mark" for r in reactions):
                 print(f"⏭️ Skipping already processed message: {msg.get('text', '')[:50]}...")
+                results[msg["ts"]] = True
                 continue
 
             text = msg.get("text", "")
             if not text.strip():
                 print("⏭️ Skipping empty message")
+                results[msg["ts"]] = True
                 continue
 
             print(f"📝 Processing message: {text[:100]}...")
-            
+
             try:
-                # Parse the message
                 parsed = parse_funding_text(text)
-                
-                if not parsed["cards"]:
-                    print("⚠️ No cards found in message, skipping...")
-                    continue
-                
-                print(f"✅ Parsed {len(parsed['cards'])} cards from: '{parsed['list_title']}'")
+            except Exception as parse_error:
+                print(f"❌ Failed to parse message: {parse_error}")
+                results[msg["ts"]] = False
+                continue
+
+            if not parsed["cards"]:
+                print("⚠️ No cards found in message, skipping...")
+                results[msg["ts"]] = True
+                continue
+
+            print(f"✅ Parsed {len(parsed['cards'])} cards from: '{parsed['list_title']}'")
+            to_process.append((msg, parsed))
+
+        processed_count = 0
 
-                # Create or get the Trello list
-                list_id = get_or_create_list(parsed["list_title"])
+        # Create cards for all messages over one shared pool; each
+        # message keeps its own futures so it's only marked processed
+        # once every one of its cards was created
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            pending = []
+            for msg, parsed in to_process:
+                # Scope a failed list resolution to this message, like
+                # any other per-message failure: it stays unhandled (so
+                # the cursor can't advance past it) while the rest of
+                # the batch proceeds
+                try:
+                    list_id = _get_list_id(parsed["list_title"])
+                except Exception as list_error:
+                    print(f"❌ Failed to resolve Trello list '{parsed['list_title']}': {list_error}")
+                    results[msg["ts"]] = False
+                    continue
                 print(f"📋 Using Trello list: {parsed['list_title']}")
 
-                # Create cards
-                for card in parsed["cards"]:
+                futures = {
+                    executor.submit(
+                        create_card,
+                        list_id=list_id,
+                        name=card["title"],
+                        desc=card["description"],
+                        attachments=card["attachments"]
+                    ): card
+                    for card in parsed["cards"]
+                }
+                pending.append((msg, futures))
+
+            to_mark = []
+            for msg, futures in pending:
+                all_created = True
+                for future, card in futures.items():
                     try:
-                        created_card = create_card(
-                            list_id=list_id,
-                            name=card["title"],
-                            desc=card["description"],
-                            attachments=card["attachments"]
-                        )
+                        future.result()
                         print(f"✅ Created card: '{card['title']}'")
                         if card["attachments"]:
                             print(f"   📎 Added {len(card['attachments'])} attachments")
                     except Exception as card_error:
+                        all_created = False
                         print(f"❌ Failed to create card '{card['title']}': {card_error}")
 
-                # Mark message as processed
+                results[msg["ts"]] = all_created
+                if all_created:
+                    to_mark.append(msg["ts"])
+
+            # Mark processed messages; the reaction adds are independent
+            # Slack calls, so they ride the same pool as the card creates
+            mark_futures = {
+                executor.submit(
+                    client.reactions_add,
+                    channel=SLACK_CHANNEL_ID,
+                    name="white_check_mark",
+                    timestamp=ts
+                ): ts
+                for ts in to_mark
+            }
+            for future in as_completed(mark_futures):
                 try:
-                    client.reactions_add(
-                        channel=SLACK_CHANNEL_ID,
-                        name="white_check_mark",
-                        timestamp=msg["ts"]
-                    )
+                    future.result()
                     print("✅ Marked message as processed")
                     processed_count += 1
                 except Exception as reaction_error:
                     print(f"⚠️ Could not add reaction: {reaction_error}")
 
-            except Exception as parse_error:
-                print(f"❌ Failed to parse message: {parse_error}")
-                continue
+        _advance_cursor(results)
 
         print(f"🎉 Processed {processed_count} new messages")
 
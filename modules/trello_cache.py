@@ -0,0 +1,59 @@
+"""
+Small on-disk TTL cache for Trello metadata (boards, lists).
+
+Board and list IDs essentially never change between cron runs, so callers
+serve the cached copy immediately and refresh it in the background
+(stale-while-revalidate) instead of paying the metadata GETs on every
+run's critical path. The cache is best-effort: any I/O or decode problem
+just falls through to a fresh fetch.
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+CACHE_DIR = Path.home() / ".cache" / "trello-sync"
+
+
+def _cache_path(key: str) -> Path:
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return CACHE_DIR / f"{digest}.json"
+
+
+def load(key: str, ttl_sec: float) -> Optional[dict]:
+    """Return the cached value for `key`, or None if absent or older than ttl_sec."""
+    try:
+        raw = _cache_path(key).read_bytes()
+        entry = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (OSError, ValueError):
+        return None
+
+    if time.time() - entry.get("stored_at", 0) > ttl_sec:
+        return None
+    return entry.get("value")
+
+
+def store(key: str, value) -> None:
+    """Persist `value` under `key`, stamped with the store time."""
+    entry = {"stored_at": time.time(), "value": value}
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        data = orjson.dumps(entry) if orjson is not None else json.dumps(entry).encode("utf-8")
+        _cache_path(key).write_bytes(data)
+    except OSError:
+        pass
+
+
+def invalidate(key: str) -> None:
+    """Drop a cached entry (e.g. after a 404 on a cached board/list id)."""
+    try:
+        _cache_path(key).unlink()
+    except OSError:
+        pass
@@ -0,0 +1,70 @@
+"""Shared HTTP session for Trello API calls.
+
+One process-wide requests.Session keeps the HTTPS connection to
+api.trello.com alive across calls, so each request skips the TLS
+handshake, and the mounted retry policy backs off automatically on
+429s and transient 5xx — no hand-rolled sleeps needed at call sites.
+"""
+
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson decodes the larger card/checklist payloads 2-5x faster than
+# the stdlib json that response.json() uses
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_body(response):
+    """Decode a JSON response body, via orjson when it's installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+_RETRY = Retry(
+    total=5,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+)
+
+def build_adapter():
+    """Pooled adapter with the shared retry policy, for modules that
+    bring their own session (e.g. a caching one)."""
+    return HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=_RETRY)
+
+class TokenBucket:
+    """Token-bucket limiter sized just under Trello's ~100 req/10s window.
+
+    acquire() returns immediately while burst quota remains and only
+    sleeps once the bucket is actually empty, unlike a fixed per-request
+    delay that pays idle time whether or not Trello is throttling.
+    """
+
+    def __init__(self, rate: float = 95, per: float = 10.0):
+        self._capacity = rate
+        self._tokens = rate
+        self._fill_rate = rate / per
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity,
+                                   self._tokens + (now - self._last) * self._fill_rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._fill_rate
+            time.sleep(wait)
+
+session = requests.Session()
+session.mount("https://", build_adapter())
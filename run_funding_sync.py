@@ -1,9 +1,12 @@
 from modules.funding_sync import parse_csv, filter_keywords, trello_writer
 
-def main():
-    csv_path = "CSV/grants-gov-opp-search--20250702135040.csv"
-    keyword_path = "modules/funding_sync/keywords.json"
+DEFAULT_CSV_PATH = "CSV/grants-gov-opp-search--20250702135040.csv"
+DEFAULT_KEYWORD_PATH = "modules/funding_sync/keywords.json"
 
+def main(csv_path=DEFAULT_CSV_PATH, keyword_path=DEFAULT_KEYWORD_PATH,
+         matched_list="Semi-Filtered", unmatched_list="Dummy List"):
+    """Run the funding sync: one parameterized entry point instead of
+    near-duplicate scripts per CSV/list combination."""
     print("🚀 Starting Funding Sync Process...")
 
     # Load keywords for cleanup
@@ -12,45 +15,34 @@ def main():
     # Clean up existing incorrectly categorized cards
     trello_writer.cleanup_existing_cards(lab_keywords)
 
-    # Load data
-    funding_entries = parse_csv.load_funding_csv(csv_path)
-    
+    # Load data; expired entries are dropped and keywords matched by
+    # vectorized masks inside the loader
+    funding_entries = parse_csv.load_funding_csv(csv_path, keywords=lab_keywords)
+
     if not funding_entries:
         print("❌ No funding entries loaded. Exiting.")
         return
 
-    # Track results
-    semi_filtered = []
-    dummy_filtered = []
-
-    for entry in funding_entries:
-        if not filter_keywords.is_future_entry(entry):
-            continue  
-
-        if filter_keywords.contains_keyword(entry, lab_keywords):
-            semi_filtered.append(entry)
-        else:
-            dummy_filtered.append(entry)
+    semi_filtered = [e for e in funding_entries if e["_kw_match"]]
+    dummy_filtered = [e for e in funding_entries if not e["_kw_match"]]
 
     print(f"\n🔎 Semi-Filtered Matches: {len(semi_filtered)}")
     print(f"📄 Dummy (Unmatched): {len(dummy_filtered)}\n")
 
-    # Create Trello cards
+    # Create Trello cards in bulk: list state is resolved once per list
+    # and the creates fan out over a thread pool inside the writer
     print("📝 Creating Trello cards...")
-    created_semi = 0
-    created_dummy = 0
-
-    for entry in semi_filtered:
-        trello_writer.create_card(entry, list_name="Semi-Filtered")
-        created_semi += 1
+    trello_writer.create_cards_bulk({
+        matched_list: semi_filtered,
+        unmatched_list: dummy_filtered,
+    })
 
-    for entry in dummy_filtered:
-        trello_writer.create_card(entry, list_name="Dummy List")
-        created_dummy += 1
+    created_semi = len(semi_filtered)
+    created_dummy = len(dummy_filtered)
 
     print(f"\n🎉 Process Complete!")
-    print(f"✅ Created {created_semi} cards in Semi-Filtered list")
-    print(f"✅ Created {created_dummy} cards in Dummy List")
+    print(f"✅ Created {created_semi} cards in {matched_list} list")
+    print(f"✅ Created {created_dummy} cards in {unmatched_list}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
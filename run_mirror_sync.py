@@ -13,13 +13,40 @@ Mirrors cards from Proposals and Papers boards to Master board based on:
 Runs every Monday at 8 AM Eastern via GitHub Actions.
 """
 
+import logging
+import logging.handlers
 import os
+import sys
 import requests
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
+from modules import trello_http
+
+logger = logging.getLogger(__name__)
+
+def configure_logging():
+    """Set up logging for script runs; importing the module stays silent.
+
+    Every per-card message used to be an unbuffered print() — one stdio
+    lock/flush/encode each. Buffering through a MemoryHandler writes CI
+    output in batches, and MIRROR_LOG_LEVEL=WARNING skips the per-card
+    chatter entirely; errors still flush immediately.
+    """
+    logging.basicConfig(
+        level=getattr(logging, os.getenv("MIRROR_LOG_LEVEL", "INFO").upper(), logging.INFO),
+        format='%(message)s',
+        stream=sys.stdout
+    )
+    root_logger = logging.getLogger()
+    root_logger.handlers[0] = logging.handlers.MemoryHandler(
+        capacity=100, flushLevel=logging.ERROR, target=root_logger.handlers[0]
+    )
+
 # Load environment variables
 TRELLO_API_KEY = os.getenv("TRELLO_API_KEY")
 TRELLO_TOKEN = os.getenv("TRELLO_TOKEN")
@@ -40,6 +67,11 @@ PROGRESS_CHECKLIST_NAME = "In-Progress"
 COMPLETED_LABEL_NAME = "Completed"
 COMPLETION_THRESHOLD = 0.75
 
+# Lowercased once here instead of on every per-card comparison
+_PRIORITY = PRIORITY_LIST_NAME.lower()
+_PROGRESS = PROGRESS_CHECKLIST_NAME.lower()
+_COMPLETED = COMPLETED_LABEL_NAME.lower()
+
 # Mirror metadata markers
 MIRROR_MARKER = "🤖 MIRROR_METADATA:"
 MIRROR_COMMENT_MARKER = "[Bot] Mirrored from"
@@ -53,79 +85,121 @@ class TrelloAPI:
         self.api_key = api_key
         self.token = token
         self.base_params = {"key": api_key, "token": token}
-    
+        # One pooled, retrying session for every call: reuses the
+        # keep-alive connection to api.trello.com instead of paying a
+        # TCP+TLS handshake per request, and carries the auth params so
+        # they aren't re-merged into every call
+        self.session = requests.Session()
+        self.session.mount("https://", trello_http.build_adapter())
+        self.session.params = self.base_params
+        self.session.headers.update(HEADERS)
+        # Shared worker pool for fanning out independent calls; sized
+        # under the adapter's connection pool so workers never block
+        # waiting for a socket
+        self.pool = ThreadPoolExecutor(max_workers=16)
+        # Keep the fan-out just under Trello's ~100 req/10s cap so we
+        # don't trade serial latency for 429 retry stalls; the mounted
+        # Retry still honors Retry-After if we do get throttled
+        self.limiter = trello_http.TokenBucket()
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        self.limiter.acquire()
+        return self.session.request(method, url, **kwargs)
+
     def get(self, endpoint: str, params: Dict = None) -> requests.Response:
         """Make GET request to Trello API"""
         url = f"https://api.trello.com/1/{endpoint}"
-        all_params = {**self.base_params, **(params or {})}
-        return requests.get(url, params=all_params, headers=HEADERS)
-    
+        return self._request("GET", url, params=params)
+
     def post(self, endpoint: str, data: Dict = None) -> requests.Response:
         """Make POST request to Trello API"""
         url = f"https://api.trello.com/1/{endpoint}"
-        all_data = {**self.base_params, **(data or {})}
-        return requests.post(url, data=all_data, headers=HEADERS)
-    
+        return self._request("POST", url, data=data)
+
     def put(self, endpoint: str, data: Dict = None) -> requests.Response:
         """Make PUT request to Trello API"""
         url = f"https://api.trello.com/1/{endpoint}"
-        all_data = {**self.base_params, **(data or {})}
-        return requests.put(url, data=all_data, headers=HEADERS)
-    
+        return self._request("PUT", url, data=data)
+
     def delete(self, endpoint: str) -> requests.Response:
         """Make DELETE request to Trello API"""
         url = f"https://api.trello.com/1/{endpoint}"
-        return requests.delete(url, params=self.base_params, headers=HEADERS)
+        return self._request("DELETE", url)
+
+# Only the fields the mirror actually reads; the unrestricted fetch
+# pulled every card property and badge, an order of magnitude more JSON
+_CARD_FETCH_PARAMS = {
+    "fields": "name,desc,due,closed,idList,idLabels,idMembers,dateLastActivity",
+    "attachments": "true",
+    "attachment_fields": "name,url",
+    "checklists": "all",
+    "checklist_fields": "name",
+    "checkItems": "all",
+    "checkItem_fields": "name,state",
+    "actions": "commentCard",
+    "action_fields": "data,type",
+    "actions_limit": 1000,
+}
 
 def get_all_cards_from_board(api: TrelloAPI, board_id: str) -> List[Dict]:
     """Get all open cards from a board with full details"""
     response = api.get(f"boards/{board_id}/cards", {
         "cards": "open",
-        "attachments": "true",
-        "checklists": "all",
-        "members": "true",
-        "actions": "commentCard",
-        "actions_limit": 1000
+        **_CARD_FETCH_PARAMS
     })
     
     if response.status_code != 200:
-        print(f"❌ Failed to fetch cards from board {board_id}: {response.text}")
+        logger.error("❌ Failed to fetch cards from board %s: %s", board_id, response.text)
         return []
     
-    return response.json()
+    return trello_http.json_body(response)
 
 def get_all_cards_from_list(api: TrelloAPI, list_id: str) -> List[Dict]:
     """Get all cards from a specific list with full details"""
-    response = api.get(f"lists/{list_id}/cards", {
-        "attachments": "true",
-        "checklists": "all",
-        "members": "true",
-        "actions": "commentCard",
-        "actions_limit": 1000
-    })
+    response = api.get(f"lists/{list_id}/cards", dict(_CARD_FETCH_PARAMS))
     
     if response.status_code != 200:
-        print(f"❌ Failed to fetch cards from list {list_id}: {response.text}")
+        logger.error("❌ Failed to fetch cards from list %s: %s", list_id, response.text)
         return []
     
-    return response.json()
+    return trello_http.json_body(response)
+
+# Per-run memo of board-level lookups: labels and list names don't
+# change mid-run, so repeated calls for the same board are dict hits
+_board_list_names_cache: Dict[str, Dict[str, str]] = {}
+_board_labels_cache: Dict[str, Dict[str, str]] = {}
+
+def get_board_list_names(api: TrelloAPI, board_id: str) -> Dict[str, str]:
+    """Get all lists for a board, return dict of {list_id: list_name}"""
+    cached = _board_list_names_cache.get(board_id)
+    if cached is not None:
+        return cached
 
-def get_list_name(api: TrelloAPI, list_id: str) -> str:
-    """Get the name of a list"""
-    response = api.get(f"lists/{list_id}")
+    response = api.get(f"boards/{board_id}/lists", {"fields": "name"})
     if response.status_code != 200:
-        print(f"❌ Failed to fetch list {list_id}: {response.text}")
-        return ""
-    return response.json().get("name", "")
+        logger.error("❌ Failed to fetch lists for board %s: %s", board_id, response.text)
+        return {}
+
+    names = {lst["id"]: lst["name"] for lst in trello_http.json_body(response)}
+    _board_list_names_cache[board_id] = names
+    return names
 
 def get_board_labels(api: TrelloAPI, board_id: str) -> Dict[str, str]:
-    """Get all labels for a board, return dict of {label_id: label_name}"""
+    """Get all labels for a board, return dict of {label_id: lowercased name}"""
+    cached = _board_labels_cache.get(board_id)
+    if cached is not None:
+        return cached
+
     response = api.get(f"boards/{board_id}/labels")
     if response.status_code != 200:
-        print(f"❌ Failed to fetch labels for board {board_id}: {response.text}")
+        logger.error("❌ Failed to fetch labels for board %s: %s", board_id, response.text)
         return {}
-    
-    return {label["id"]: label["name"] for label in response.json()}
+
+    # Lowercase once at fetch time so the per-card label check is a
+    # plain equality against the pre-lowered constant
+    labels = {label["id"]: label["name"].lower() for label in trello_http.json_body(response)}
+    _board_labels_cache[board_id] = labels
+    return labels
 
 def find_card_by_name_and_desc(api: TrelloAPI, board_id: str, card_name: str, original_desc: str) -> Optional[Dict]:
     """Find a card on a board by name and original description content"""
@@ -139,23 +213,31 @@ def find_card_by_name_and_desc(api: TrelloAPI, board_id: str, card_name: str, or
     
     return None
 
-def extract_mirror_metadata(description: str) -> Optional[Dict]:
-    """Extract mirror metadata from card description"""
-    if MIRROR_MARKER not in description:
-        return None
-    
+# The metadata JSON sits on the marker's line; one compiled search
+# replaces the membership test plus two .find() scans per master card
+_MIRROR_RE = re.compile(re.escape(MIRROR_MARKER) + r"([^\n]*)")
+
+def parse_mirrored_desc(description: str) -> Tuple[str, Optional[Dict]]:
+    """Split a master card description into the user-visible text and
+    the parsed mirror metadata, scanning the string once."""
+    match = _MIRROR_RE.search(description)
+    if match is None:
+        return description, None
+
     try:
-        # Find the metadata JSON
-        start = description.find(MIRROR_MARKER) + len(MIRROR_MARKER)
-        end = description.find("\n", start)
-        if end == -1:
-            end = len(description)
-        
-        metadata_str = description[start:end].strip()
-        return json.loads(metadata_str)
+        metadata = json.loads(match.group(1).strip())
     except (json.JSONDecodeError, ValueError) as e:
-        print(f"⚠️  Failed to parse mirror metadata: {e}")
-        return None
+        logger.warning("⚠️  Failed to parse mirror metadata: %s", e)
+        metadata = None
+    return description[:match.start()].strip(), metadata
+
+def extract_mirror_metadata(description: str) -> Optional[Dict]:
+    """Extract mirror metadata from card description"""
+    return parse_mirrored_desc(description)[1]
+
+# One timestamp per run: every mirrored card in a run is stamped the
+# same, saving a utcnow/isoformat pair per card
+_RUN_TS = datetime.utcnow().isoformat()
 
 def create_mirror_metadata(source_board_id: str, source_card_id: str, original_desc: str) -> str:
     """Create mirror metadata to embed in card description"""
@@ -163,72 +245,60 @@ def create_mirror_metadata(source_board_id: str, source_card_id: str, original_d
         "source_board": source_board_id,
         "source_card": source_card_id,
         "original_desc": original_desc,
-        "mirrored_at": datetime.utcnow().isoformat()
+        "mirrored_at": _RUN_TS
     }
-    return f"{MIRROR_MARKER}{json.dumps(metadata)}"
+    # Compact separators: the metadata rides inside every mirrored
+    # card's size-limited description, so don't spend bytes on spaces
+    return f"{MIRROR_MARKER}{json.dumps(metadata, separators=(',', ':'))}"
 
 def has_completed_label(card: Dict, board_labels: Dict[str, str]) -> bool:
     """Check if card has a 'Completed' label (case-insensitive)"""
     for label_id in card.get("idLabels", []):
-        label_name = board_labels.get(label_id, "")
-        if label_name.lower() == COMPLETED_LABEL_NAME.lower():
+        if board_labels.get(label_id) == _COMPLETED:
             return True
     return False
 
-def get_checklist_progress(card: Dict, checklist_name: str) -> float:
-    """Get completion percentage for a specific checklist"""
-    for checklist in card.get("checklists", []):
-        if checklist["name"].lower() == checklist_name.lower():
-            total_items = len(checklist["checkItems"])
-            if total_items == 0:
-                return 0.0
-            completed_items = sum(1 for item in checklist["checkItems"] if item["state"] == "complete")
-            return completed_items / total_items
-    return 0.0
-
-def should_mirror_card(api: TrelloAPI, card: Dict, board_labels: Dict[str, str]) -> bool:
-    """Determine if a card should be mirrored based on criteria"""
-    # Skip if card has "Completed" label
-    if has_completed_label(card, board_labels):
-        print(f"🚫 Skipping '{card['name']}' - has Completed label")
-        return False
-    
-    # Check if card is in Priority IV list
-    list_name = get_list_name(api, card["idList"])
-    if list_name.lower() == PRIORITY_LIST_NAME.lower():
-        print(f"✅ '{card['name']}' - in Priority IV list")
-        return True
-    
-    # Check if card has In-Progress checklist ≥ 75% complete
-    progress = get_checklist_progress(card, PROGRESS_CHECKLIST_NAME)
-    if progress >= COMPLETION_THRESHOLD:
-        print(f"✅ '{card['name']}' - In-Progress checklist {progress:.1%} complete")
-        return True
-    
-    if progress > 0:
-        print(f"⏳ Skipping '{card['name']}' - In-Progress checklist only {progress:.1%} complete")
-    else:
-        print(f"⏳ Skipping '{card['name']}' - no qualifying criteria met")
-    
-    return False
-
-def sync_card_changes(api: TrelloAPI, master_card: Dict, source_board_id: str, source_card_id: str, original_desc: str) -> bool:
-    """Sync changes from master card back to source card"""
-    print(f"🔄 Syncing changes for '{master_card['name']}' back to source...")
-    
-    # Get current source card
-    source_response = api.get(f"cards/{source_card_id}", {
-        "attachments": "true",
-        "checklists": "all",
-        "members": "true"
+def get_card(api: TrelloAPI, card_id: str) -> Optional[Dict]:
+    """Fetch a single card with the mirror's field set"""
+    response = api.get(f"cards/{card_id}", dict(_CARD_FETCH_PARAMS))
+    if response.status_code != 200:
+        logger.error("❌ Failed to fetch card %s: %s", card_id, response.text)
+        return None
+    return trello_http.json_body(response)
+
+def get_progress_qualified_card_ids(api: TrelloAPI, board_id: str) -> List[str]:
+    """Ids of cards whose In-Progress checklist is ≥ 75% complete.
+
+    Scans the board's checklists (names and item states only) so the
+    threshold can be computed without downloading any card bodies.
+    """
+    response = api.get(f"boards/{board_id}/checklists", {
+        "fields": "name,idCard",
+        "checkItems": "all",
+        "checkItem_fields": "state"
     })
-    
-    if source_response.status_code != 200:
-        print(f"❌ Could not find source card {source_card_id}: {source_response.text}")
-        return False
-    
-    source_card = source_response.json()
-    
+    if response.status_code != 200:
+        logger.error("❌ Failed to fetch checklists for board %s: %s", board_id, response.text)
+        return []
+
+    qualified = []
+    for checklist in trello_http.json_body(response):
+        if checklist["name"].lower() != _PROGRESS:
+            continue
+        items = checklist.get("checkItems", [])
+        if not items:
+            continue
+        progress = sum(1 for item in items if item["state"] == "complete") / len(items)
+        if progress >= COMPLETION_THRESHOLD:
+            qualified.append(checklist["idCard"])
+    return qualified
+
+def sync_card_changes(api: TrelloAPI, master_card: Dict, source_card: Dict, clean_desc: str) -> bool:
+    """Sync changes from master card back to the prefetched source card"""
+    logger.info("🔄 Syncing changes for '%s' back to source...", master_card['name'])
+
+    source_card_id = source_card["id"]
+
     # Update source card with changes from master
     updates = {}
     
@@ -236,15 +306,8 @@ def sync_card_changes(api: TrelloAPI, master_card: Dict, source_board_id: str, s
     if master_card["name"] != source_card["name"]:
         updates["name"] = master_card["name"]
     
-    # Update description (remove mirror metadata and restore original)
-    master_desc = master_card.get("desc", "")
-    if MIRROR_MARKER in master_desc:
-        # Extract the modified description (everything before the mirror marker)
-        desc_end = master_desc.find(MIRROR_MARKER)
-        clean_desc = master_desc[:desc_end].strip()
-    else:
-        clean_desc = master_desc
-    
+    # Update description: the caller already split off the mirror
+    # metadata, so the cleaned text arrives pre-computed
     if clean_desc != source_card.get("desc", ""):
         updates["desc"] = clean_desc
     
@@ -256,12 +319,12 @@ def sync_card_changes(api: TrelloAPI, master_card: Dict, source_board_id: str, s
     if updates:
         response = api.put(f"cards/{source_card_id}", updates)
         if response.status_code != 200:
-            print(f"❌ Failed to update source card: {response.text}")
+            logger.error("❌ Failed to update source card: %s", response.text)
             return False
     
     # Sync checklists
-    sync_checklists(api, master_card, source_card_id)
-    
+    sync_checklists(api, master_card, source_card, source_card_id)
+
     # Sync members
     sync_members(api, master_card, source_card, source_card_id)
     
@@ -269,141 +332,186 @@ def sync_card_changes(api: TrelloAPI, master_card: Dict, source_board_id: str, s
     sync_attachments(api, master_card, source_card, source_card_id)
     
     # Sync comments (non-bot comments)
-    sync_comments(api, master_card, source_card_id)
+    sync_comments(api, master_card, source_card, source_card_id)
     
-    print(f"✅ Successfully synced changes for '{master_card['name']}'")
+    logger.info("✅ Successfully synced changes for '%s'", master_card['name'])
     return True
 
-def sync_checklists(api: TrelloAPI, master_card: Dict, source_card_id: str):
+def sync_checklists(api: TrelloAPI, master_card: Dict, source_card: Dict, source_card_id: str):
     """Sync checklists from master card to source card"""
-    # Get current source card checklists
-    source_response = api.get(f"cards/{source_card_id}/checklists")
-    if source_response.status_code != 200:
-        return
-    
-    source_checklists = source_response.json()
-    
-    # Create a mapping of checklist names to IDs for the source card
-    source_checklist_map = {cl["name"]: cl["id"] for cl in source_checklists}
-    
-    # Sync each checklist from master
+    # The board-level prefetch already carries each source card's
+    # checklists with their items, so no per-card fetches here
+    source_checklist_map = {cl["name"]: cl for cl in source_card.get("checklists", [])}
+
+    # Collect every needed item write, then fan them out together —
+    # they're independent calls, so K changed items cost ~1 RTT, not K
+    futures = []
     for master_checklist in master_card.get("checklists", []):
         checklist_name = master_checklist["name"]
-        
+
         if checklist_name in source_checklist_map:
             # Update existing checklist
-            source_checklist_id = source_checklist_map[checklist_name]
-            
-            # Get current checklist items
-            source_cl_response = api.get(f"checklists/{source_checklist_id}")
-            if source_cl_response.status_code != 200:
-                continue
-            
-            source_cl = source_cl_response.json()
+            source_cl = source_checklist_map[checklist_name]
+            source_checklist_id = source_cl["id"]
             source_items = {item["name"]: item for item in source_cl.get("checkItems", [])}
-            
+
             # Update checklist items
             for master_item in master_checklist.get("checkItems", []):
                 item_name = master_item["name"]
                 item_state = master_item["state"]
-                
+
                 if item_name in source_items:
                     # Update existing item state
                     source_item = source_items[item_name]
                     if source_item["state"] != item_state:
-                        api.put(f"cards/{source_card_id}/checkItem/{source_item['id']}", {
-                            "state": item_state
-                        })
+                        futures.append(api.pool.submit(
+                            api.put,
+                            f"cards/{source_card_id}/checkItem/{source_item['id']}",
+                            {"state": item_state}))
                 else:
                     # Add new item
-                    api.post(f"checklists/{source_checklist_id}/checkItems", {
-                        "name": item_name,
-                        "checked": str(item_state == "complete").lower()
-                    })
+                    futures.append(api.pool.submit(
+                        api.post,
+                        f"checklists/{source_checklist_id}/checkItems",
+                        {"name": item_name,
+                         "checked": str(item_state == "complete").lower()}))
+
+    for future in as_completed(futures):
+        response = future.result()
+        if response.status_code != 200:
+            logger.warning("⚠️  Checklist item sync failed for card %s: %s",
+                           source_card_id, response.text)
 
 def sync_members(api: TrelloAPI, master_card: Dict, source_card: Dict, source_card_id: str):
     """Sync members from master card to source card"""
     master_members = set(master_card.get("idMembers", []))
     source_members = set(source_card.get("idMembers", []))
-    
-    # Add new members
-    for member_id in master_members - source_members:
-        api.post(f"cards/{source_card_id}/idMembers", {"value": member_id})
-    
-    # Remove members no longer on master
-    for member_id in source_members - master_members:
-        api.delete(f"cards/{source_card_id}/idMembers/{member_id}")
+
+    # One PUT sets the full member list, replacing the per-member
+    # add/remove round-trips
+    if master_members != source_members:
+        api.put(f"cards/{source_card_id}", {
+            "idMembers": ",".join(master_card.get("idMembers", []))
+        })
+
+def _attachment_key(att: Dict) -> str:
+    """Stable identity for an attachment: URL when it has one, else a
+    name-prefixed key so URL-less uploads don't all collapse onto ''."""
+    return att.get("url") or f"name:{att.get('name', '')}"
 
 def sync_attachments(api: TrelloAPI, master_card: Dict, source_card: Dict, source_card_id: str):
     """Sync attachments from master card to source card"""
-    master_attachments = {att.get("url", att.get("name", "")): att for att in master_card.get("attachments", [])}
-    source_attachments = {att.get("url", att.get("name", "")): att for att in source_card.get("attachments", [])}
-    
+    master_attachments = {_attachment_key(att): att for att in master_card.get("attachments", [])}
+    source_attachments = {_attachment_key(att) for att in source_card.get("attachments", [])}
+
     # Add new attachments
     for att_key, attachment in master_attachments.items():
         if att_key not in source_attachments and attachment.get("url"):
             api.post(f"cards/{source_card_id}/attachments", {"url": attachment["url"]})
 
-def sync_comments(api: TrelloAPI, master_card: Dict, source_card_id: str):
+def sync_comments(api: TrelloAPI, master_card: Dict, source_card: Dict, source_card_id: str):
     """Sync non-bot comments from master card to source card"""
-    master_comments = []
-    
-    # Get comments from master card
+    # Comments already on the source card, from the board prefetch —
+    # re-running the sync no longer re-posts every comment each week.
+    # The fetch filters actions to commentCard with data/type fields,
+    # so no defensive .get chains with throwaway default dicts here.
+    existing = {
+        action["data"]["text"]
+        for action in source_card.get("actions", [])
+        if action["data"].get("text")
+    }
+
+    new_comments = []
     for action in master_card.get("actions", []):
-        if (action.get("type") == "commentCard" and 
-            action.get("data", {}).get("text") and
-            not action.get("data", {}).get("text", "").startswith(MIRROR_COMMENT_MARKER)):
-            master_comments.append(action["data"]["text"])
-    
-    # Add comments to source card (Note: We can't easily check for duplicates without more complex logic)
-    for comment in master_comments:
-        api.post(f"cards/{source_card_id}/actions/comments", {"text": comment})
+        text = action["data"].get("text")
+        if (text and not text.startswith(MIRROR_COMMENT_MARKER)
+                and text not in existing):
+            new_comments.append(text)
+
+    # Each comment POST is independent, so fan them out over the pool
+    list(api.pool.map(
+        lambda text: api.post(f"cards/{source_card_id}/actions/comments", {"text": text}),
+        new_comments))
 
 def sync_changes_from_master(api: TrelloAPI) -> int:
     """Sync changes from master board back to source boards"""
-    print("\n🔄 Phase 1: Syncing changes from Master board back to source boards...")
+    logger.info("\n🔄 Phase 1: Syncing changes from Master board back to source boards...")
     
     synced_count = 0
-    
+
+    # One bulk GET per source board instead of two round-trips per
+    # mirrored card: each sync below is then pure dict lookups
+    source_cards_by_id: Dict[str, Dict] = {}
+    for board_id in (PROPOSALS_BOARD_ID, PAPERS_BOARD_ID):
+        for source_card in get_all_cards_from_board(api, board_id):
+            source_cards_by_id[source_card["id"]] = source_card
+
     # Process both master lists
     for list_id, board_name in [(MASTER_PROPOSALS_LIST_ID, "Proposals"), (MASTER_PAPERS_LIST_ID, "Papers")]:
-        print(f"\n📋 Processing Master {board_name} list...")
-        
+        logger.info("\n📋 Processing Master %s list...", board_name)
+
         cards = get_all_cards_from_list(api, list_id)
-        
+
         for card in cards:
-            metadata = extract_mirror_metadata(card.get("desc", ""))
-            
+            # One scan yields both the metadata and the cleaned text
+            # that sync_card_changes compares against the source desc
+            clean_desc, metadata = parse_mirrored_desc(card.get("desc", ""))
+
             if metadata:
                 source_board_id = metadata.get("source_board")
                 source_card_id = metadata.get("source_card")
-                original_desc = metadata.get("original_desc", "")
-                
+
                 if source_board_id and source_card_id:
-                    if sync_card_changes(api, card, source_board_id, source_card_id, original_desc):
+                    source_card = source_cards_by_id.get(source_card_id)
+                    if source_card is None:
+                        logger.warning("⚠️  Source card for '%s' no longer exists - skipping", card['name'])
+                    elif sync_card_changes(api, card, source_card, clean_desc):
                         synced_count += 1
                 else:
-                    print(f"⚠️  Invalid metadata for card '{card['name']}'")
+                    logger.warning("⚠️  Invalid metadata for card '%s'", card['name'])
             else:
-                print(f"⚠️  No mirror metadata found for card '{card['name']}'")
+                logger.warning("⚠️  No mirror metadata found for card '%s'", card['name'])
     
-    print(f"🔄 Phase 1 Complete: Synced {synced_count} cards back to source boards")
+    logger.info("🔄 Phase 1 Complete: Synced %s cards back to source boards", synced_count)
     return synced_count
 
-def clear_list(api: TrelloAPI, list_id: str, list_name: str) -> None:
-    """Clear all cards from a list"""
-    response = api.get(f"lists/{list_id}/cards")
+# Last-seen dateLastActivity per source card, persisted between runs so
+# unchanged cards keep their existing mirror instead of being wiped and
+# rebuilt (card create + members + labels + checklists) every Monday
+_MIRROR_STATE_FILE = Path.home() / ".cache" / "trello-sync" / "mirror_state.json"
+
+def _load_mirror_state() -> Dict[str, str]:
+    try:
+        return json.loads(_MIRROR_STATE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+def _store_mirror_state(state: Dict[str, str]) -> None:
+    try:
+        _MIRROR_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _MIRROR_STATE_FILE.write_text(json.dumps(state))
+    except OSError as e:
+        logger.warning("⚠️  Could not persist mirror state: %s", e)
+
+def get_existing_mirrors(api: TrelloAPI, list_id: str) -> Dict[str, str]:
+    """Map source card ids to mirror card ids for a master list.
+
+    Cards without parseable mirror metadata are deleted — they can't be
+    matched to a source, so they'd otherwise accumulate forever.
+    """
+    response = api.get(f"lists/{list_id}/cards", {"fields": "desc"})
     if response.status_code != 200:
-        print(f"❌ Failed to fetch cards from {list_name}: {response.text}")
-        return
-    
-    cards = response.json()
-    for card in cards:
-        delete_response = api.delete(f"cards/{card['id']}")
-        if delete_response.status_code != 200:
-            print(f"❌ Failed to delete card '{card['name']}': {delete_response.text}")
-    
-    print(f"🧹 Cleared {len(cards)} cards from {list_name} list")
+        logger.error("❌ Failed to fetch mirror cards from list %s: %s", list_id, response.text)
+        return {}
+
+    mirrors: Dict[str, str] = {}
+    for card in trello_http.json_body(response):
+        metadata = extract_mirror_metadata(card.get("desc", ""))
+        if metadata and metadata.get("source_card"):
+            mirrors[metadata["source_card"]] = card["id"]
+        else:
+            api.delete(f"cards/{card['id']}")
+    return mirrors
 
 def mirror_card(api: TrelloAPI, card: Dict, target_list_id: str, source_board_name: str, source_board_id: str) -> bool:
     """Mirror a card to the target list with all its properties and metadata"""
@@ -412,7 +520,8 @@ def mirror_card(api: TrelloAPI, card: Dict, target_list_id: str, source_board_na
     # Create mirror metadata
     mirror_metadata = create_mirror_metadata(source_board_id, card["id"], original_desc)
     
-    # Create the card with embedded metadata
+    # Create the card with embedded metadata; members and labels ride
+    # the create payload as comma-separated ids instead of one POST each
     card_data = {
         "idList": target_list_id,
         "name": card["name"],
@@ -420,100 +529,171 @@ def mirror_card(api: TrelloAPI, card: Dict, target_list_id: str, source_board_na
         "due": card.get("due", ""),
         "pos": "bottom"
     }
-    
+    if card.get("idMembers"):
+        card_data["idMembers"] = ",".join(card["idMembers"])
+    if card.get("idLabels"):
+        card_data["idLabels"] = ",".join(card["idLabels"])
+
     response = api.post("cards", card_data)
     if response.status_code != 200:
-        print(f"❌ Failed to create card '{card['name']}': {response.text}")
+        logger.error("❌ Failed to create card '%s': %s", card['name'], response.text)
         return False
     
-    new_card = response.json()
+    new_card = trello_http.json_body(response)
     new_card_id = new_card["id"]
-    
-    # Add members
-    for member_id in card.get("idMembers", []):
-        api.post(f"cards/{new_card_id}/idMembers", {"value": member_id})
-    
-    # Add labels
-    for label_id in card.get("idLabels", []):
-        api.post(f"cards/{new_card_id}/idLabels", {"value": label_id})
-    
-    # Add attachments
+
+    # The attachment/comment adds are independent HTTP round trips, so
+    # fan them out over the shared pool instead of paying one RTT each;
+    # dedupe by URL so a doubled source attachment posts once
+    posts = []
+    seen_urls = set()
     for attachment in card.get("attachments", []):
-        if attachment.get("url"):
-            api.post(f"cards/{new_card_id}/attachments", {"url": attachment["url"]})
-    
-    # Mirror checklists
+        url = attachment.get("url")
+        if url and url not in seen_urls:
+            seen_urls.add(url)
+            posts.append((f"cards/{new_card_id}/attachments", {"url": url}))
+    posts.append((f"cards/{new_card_id}/actions/comments", {
+        "text": f"{MIRROR_COMMENT_MARKER} {source_board_name} board"
+    }))
+
+    futures = [api.pool.submit(api.post, endpoint, data) for endpoint, data in posts]
+
+    # Each checklist POST must complete before its items can be added
+    # (we need the new checklist id), but the items themselves fan out
     for checklist in card.get("checklists", []):
         checklist_response = api.post(f"cards/{new_card_id}/checklists", {"name": checklist["name"]})
         if checklist_response.status_code == 200:
-            new_checklist_id = checklist_response.json()["id"]
-            
-            # Add checklist items
-            for item in checklist.get("checkItems", []):
+            new_checklist_id = trello_http.json_body(checklist_response)["id"]
+
+            for i, item in enumerate(checklist.get("checkItems", [])):
                 item_data = {
                     "name": item["name"],
-                    "checked": str(item["state"] == "complete").lower()
+                    "checked": str(item["state"] == "complete").lower(),
+                    # Explicit positions keep source order even though the
+                    # POSTs land in whatever order the pool finishes them
+                    "pos": (i + 1) * 1000
                 }
-                api.post(f"checklists/{new_checklist_id}/checkItems", item_data)
-    
-    # Add mirror comment
-    api.post(f"cards/{new_card_id}/actions/comments", {
-        "text": f"{MIRROR_COMMENT_MARKER} {source_board_name} board"
-    })
-    
-    print(f"✅ Successfully mirrored: '{card['name']}'")
+                futures.append(api.pool.submit(
+                    api.post, f"checklists/{new_checklist_id}/checkItems", item_data))
+
+    for future in as_completed(futures):
+        sub_response = future.result()
+        if sub_response.status_code != 200:
+            logger.warning("⚠️  Sub-resource call failed for '%s': %s", card['name'], sub_response.text)
+
+    logger.info("✅ Successfully mirrored: '%s'", card['name'])
     return True
 
-def process_board(api: TrelloAPI, board_id: str, board_name: str, master_list_id: str) -> int:
+def process_board(api: TrelloAPI, board_id: str, board_name: str, master_list_id: str,
+                  prev_state: Dict[str, str], new_state: Dict[str, str]) -> int:
     """Process a board and mirror qualifying cards"""
-    print(f"\n📋 Processing {board_name} board...")
-    
-    # Get all cards and board labels
-    cards = get_all_cards_from_board(api, board_id)
+    logger.info("\n📋 Processing %s board...", board_name)
+
     board_labels = get_board_labels(api, board_id)
-    
-    if not cards:
-        print(f"⚠️  No cards found on {board_name} board")
+    list_names = get_board_list_names(api, board_id)
+
+    # Mirrors already on the master list, keyed by source card id, so
+    # unchanged cards can keep theirs instead of being rebuilt
+    existing_mirrors = get_existing_mirrors(api, master_list_id)
+
+    # Fetch only cards that can qualify, instead of downloading the
+    # whole board and filtering client-side: everything in the Priority
+    # IV list, plus cards found via the board-level checklist scan
+    candidates: Dict[str, Dict] = {}
+
+    priority_list_id = next(
+        (list_id for list_id, name in list_names.items()
+         if name.lower() == _PRIORITY), None)
+    if priority_list_id:
+        for card in get_all_cards_from_list(api, priority_list_id):
+            logger.info("✅ '%s' - in Priority IV list", card['name'])
+            candidates[card["id"]] = card
+    else:
+        logger.warning("⚠️  No '%s' list on %s board", PRIORITY_LIST_NAME, board_name)
+
+    for card_id in get_progress_qualified_card_ids(api, board_id):
+        if card_id in candidates:
+            continue
+        card = get_card(api, card_id)
+        if card is None:
+            continue
+        # The board checklist scan also returns checklists on archived
+        # cards; those never qualified when only open cards were fetched
+        if card.get("closed"):
+            continue
+        logger.info("✅ '%s' - In-Progress checklist ≥ %.0f%% complete", card['name'], COMPLETION_THRESHOLD * 100)
+        candidates[card_id] = card
+
+    if not candidates:
+        logger.warning("⚠️  No qualifying cards found on %s board", board_name)
         return 0
-    
-    print(f"📊 Found {len(cards)} cards on {board_name} board")
-    
+
+    logger.info("📊 Found %s qualifying cards on %s board", len(candidates), board_name)
+
     # Process each card
     mirrored_count = 0
-    for card in cards:
-        if should_mirror_card(api, card, board_labels):
-            if mirror_card(api, card, master_list_id, board_name, board_id):
-                mirrored_count += 1
-    
-    print(f"📤 Mirrored {mirrored_count} cards from {board_name} board")
+    for card_id, card in candidates.items():
+        if has_completed_label(card, board_labels):
+            # Any leftover mirror is cleaned up with the stale ones below
+            logger.info("🚫 Skipping '%s' - has Completed label", card['name'])
+            continue
+
+        mirror_id = existing_mirrors.pop(card_id, None)
+        last_activity = card.get("dateLastActivity")
+
+        # Unchanged since the last run: the existing mirror is already
+        # correct, so skip the whole create + sub-resource fan-out
+        if mirror_id and last_activity and prev_state.get(card_id) == last_activity:
+            logger.info("⏭️  '%s' unchanged since last run - keeping existing mirror", card['name'])
+            new_state[card_id] = last_activity
+            continue
+
+        if mirror_id:
+            api.delete(f"cards/{mirror_id}")
+        if mirror_card(api, card, master_list_id, board_name, board_id):
+            mirrored_count += 1
+            if last_activity:
+                new_state[card_id] = last_activity
+
+    # Whatever is left no longer qualifies (moved out of Priority IV,
+    # checklist dropped below threshold, completed, archived...)
+    if existing_mirrors:
+        list(api.pool.map(lambda mirror_id: api.delete(f"cards/{mirror_id}"),
+                          existing_mirrors.values()))
+        logger.info("🧹 Removed %s stale mirrors from %s list", len(existing_mirrors), board_name)
+
+    logger.info("📤 Mirrored %s cards from %s board", mirrored_count, board_name)
     return mirrored_count
 
 def main():
     """Main execution function"""
-    print("🚀 Starting Trello Card Bi-Directional Mirror Script")
-    print(f"⏰ Started at: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}")
+    logger.info("🚀 Starting Trello Card Bi-Directional Mirror Script")
+    logger.info("⏰ Started at: %s", datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC'))
     
     # Initialize API
     api = TrelloAPI(TRELLO_API_KEY, TRELLO_TOKEN)
     
     # Phase 1: Sync changes from master back to source boards
     synced_count = sync_changes_from_master(api)
-    
-    # Phase 2: Clear master board lists and re-mirror
-    print("\n🧹 Phase 2: Clearing Master Board lists...")
-    clear_list(api, MASTER_PROPOSALS_LIST_ID, "Master Proposals")
-    clear_list(api, MASTER_PAPERS_LIST_ID, "Master Papers")
-    
-    # Phase 3: Mirror qualifying cards from source boards
-    print("\n📤 Phase 3: Mirroring qualifying cards to Master board...")
+
+    # Phase 2: Mirror qualifying cards from source boards, reusing
+    # mirrors of cards untouched since the last run instead of wiping
+    # the master lists and recreating everything
+    logger.info("\n📤 Phase 2: Mirroring qualifying cards to Master board...")
+    prev_state = _load_mirror_state()
+    new_state: Dict[str, str] = {}
     total_mirrored = 0
-    total_mirrored += process_board(api, PROPOSALS_BOARD_ID, "Proposals", MASTER_PROPOSALS_LIST_ID)
-    total_mirrored += process_board(api, PAPERS_BOARD_ID, "Papers", MASTER_PAPERS_LIST_ID)
+    total_mirrored += process_board(api, PROPOSALS_BOARD_ID, "Proposals", MASTER_PROPOSALS_LIST_ID,
+                                    prev_state, new_state)
+    total_mirrored += process_board(api, PAPERS_BOARD_ID, "Papers", MASTER_PAPERS_LIST_ID,
+                                    prev_state, new_state)
+    _store_mirror_state(new_state)
     
-    print(f"\n🎉 Script completed successfully!")
-    print(f"🔄 Cards synced back to source: {synced_count}")
-    print(f"📤 Cards mirrored to master: {total_mirrored}")
-    print(f"⏰ Finished at: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}")
+    logger.info("\n🎉 Script completed successfully!")
+    logger.info("🔄 Cards synced back to source: %s", synced_count)
+    logger.info("📤 Cards mirrored to master: %s", total_mirrored)
+    logger.info("⏰ Finished at: %s", datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC'))
 
 if __name__ == "__main__":
+    configure_logging()
     main()